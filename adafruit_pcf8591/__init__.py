@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_pcf8591`
+================================================================================
+
+CircuitPython library for the PCF8591 ADC/DAC.
+
+`PCF8591`, `AnalogIn` and `AnalogOut` can be imported from the package directly. Their
+modules are only loaded on first use, so importing the package costs almost nothing.
+
+.. code-block:: python
+
+    from adafruit_pcf8591 import PCF8591, AnalogIn
+
+* Author(s): Adafruit Industries
+"""
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from adafruit_pcf8591.analog_in import AnalogIn
+    from adafruit_pcf8591.analog_out import AnalogOut
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+__all__ = ["AnalogIn", "AnalogOut", "PCF8591"]
+
+# the submodule each name is loaded from
+_LAZY = {
+    "PCF8591": "pcf8591",
+    "AnalogIn": "analog_in",
+    "AnalogOut": "analog_out",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(__import__(f"{__name__}.{module}", None, None, (name,)), name)
+    # later lookups find the name without calling __getattr__
+    globals()[name] = value
+    return value
@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`aio`
+================================================================================
+
+asyncio support for the PCF8591 driver.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* On Linux with Adafruit Blinka, blocking I2C calls are run in the event loop's default
+  executor. On CircuitPython, where the event loop has no executor, they are run directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from circuitpython_typing import WriteableBuffer
+
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+
+def _lock_for(device: typing.Any) -> asyncio.Lock:
+    # created on first use so that it belongs to the running event loop
+    lock = getattr(device, "_async_lock", None)
+    if lock is None:
+        lock = asyncio.Lock()
+        device._async_lock = lock
+    return lock
+
+
+async def run_serialized(device: typing.Any, func: typing.Callable, *args: typing.Any):
+    """Run a blocking call for a device without blocking the event loop.
+
+    Calls for the same device run one at a time, in the order they were made, while calls
+    for other devices can run at the same time.
+
+    :param device: The `PCF8591` (or other object) the call accesses
+    :param func: The blocking function to call
+    :param args: The arguments to pass to ``func``
+    :return: The value returned by ``func``
+    """
+    if device is None:
+        # a released device raises its own error from func
+        return func(*args)
+    async with _lock_for(device):
+        loop = asyncio.get_event_loop()
+        run_in_executor = getattr(loop, "run_in_executor", None)
+        if run_in_executor is None:
+            return func(*args)
+        return await run_in_executor(None, func, *args)
+
+
+class AsyncSampleIterator:
+    """Asynchronous iterator that reads every ADC channel of a `PCF8591` at a target rate.
+
+    Each iteration returns the same buffer, refilled by `PCF8591.read_all`. Sampling times
+    are scheduled from a fixed start time so that delays don't accumulate; if a sample is
+    late the schedule restarts from the time it was taken.
+
+    :param ~adafruit_pcf8591.pcf8591.PCF8591 pcf: The PCF8591 to read.
+    :param float rate: The number of samples to take per second
+    :param buffer: Optional buffer of at least ``pcf.channel_count`` bytes to fill with
+        each sample. If not given, a new ``bytearray`` is created
+    :param int count: The number of samples to take before stopping, or None to never stop
+    """
+
+    def __init__(
+        self,
+        pcf: PCF8591,
+        rate: float,
+        buffer: WriteableBuffer | None = None,
+        count: int | None = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self._pcf = pcf
+        self._period = 1 / rate
+        self._buffer = bytearray(pcf.channel_count) if buffer is None else buffer
+        self._remaining = count
+        self._deadline = None
+
+    def __aiter__(self) -> AsyncSampleIterator:
+        return self
+
+    async def __anext__(self) -> WriteableBuffer:
+        if self._remaining is not None:
+            if self._remaining <= 0:
+                raise StopAsyncIteration
+            self._remaining -= 1
+
+        now = time.monotonic()
+        if self._deadline is None:
+            self._deadline = now
+        elif now < self._deadline:
+            await asyncio.sleep(self._deadline - now)
+        else:
+            self._deadline = now
+        self._deadline += self._period
+        return await run_serialized(self._pcf, self._pcf.read_all, self._buffer)
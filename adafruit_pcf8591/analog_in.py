@@ -27,28 +27,82 @@ AnalogIn for ADC readings.
 * Author(s): Bryan Siepert, adpted from ADS1x15 by Carter Nelson
 """
 
-try:
-    import typing
+from __future__ import annotations
+
+from array import array
 
-    from typing_extensions import Literal
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+    from typing import Literal
 
+    from adafruit_pcf8591.calibration import Calibration
+    from adafruit_pcf8591.filters import Filter
     from adafruit_pcf8591.pcf8591 import PCF8591
-except ImportError:
-    pass
 
 
 class AnalogIn:
     """AnalogIn Mock Implementation for ADC Reads."""
 
+    # no instance __dict__, as many are often kept alive at once
+    __slots__ = ("_burst", "_calibration", "_channel_number", "_filter", "_pcf", "_scale", "_table")
+
     def __init__(self, pcf: PCF8591, pin: Literal[0, 1, 2, 3]) -> None:
         """AnalogIn
 
-        :param pcf: The PCF8591 object.
+        :param pcf: The PCF8591 object, or a `PCF8591Sampler` to return its latest buffered
+            samples without accessing the bus.
         :param int pin: Required ADC channel pin; must be 0-3 inclusive
 
         """
         self._pcf = pcf
         self._channel_number = pin
+        # the reference voltage is fixed when the PCF8591 is created
+        self._scale = pcf.reference_voltage / 65535
+        self._table = None
+        self.calibration = getattr(pcf, "calibration", None)
+        self._filter = None
+        self._burst = None
+
+    @property
+    def calibration(self) -> Calibration | None:
+        """The `Calibration` applied to `value` and `voltage`, or None. Defaults to the
+        `PCF8591.calibration` at the time the AnalogIn was created"""
+        return self._calibration
+
+    @calibration.setter
+    def calibration(self, calibration: Calibration | None) -> None:
+        self._calibration = calibration
+        self._table = (
+            None if calibration is None else calibration.channel_table(self._channel_number)
+        )
+
+    @property
+    def filter(self) -> Filter | None:
+        """A `Filter` from `adafruit_pcf8591.filters`, or None. When set, each access of `value`
+        or `voltage` reads a burst of ``filter.samples`` readings, adds them to the filter and
+        returns its output, which is not calibrated. ``filter.value`` returns the latest output
+        without accessing the bus"""
+        return self._filter
+
+    @filter.setter
+    def filter(self, new_filter: Filter | None) -> None:
+        self._filter = new_filter
+        self._burst = None if new_filter is None else bytearray(new_filter.samples)
+
+    @property
+    def bits(self) -> int:
+        """The effective resolution of `value` in bits; more than the native 8 bits when an
+        oversampling `filter` is set"""
+        return 8 if self._filter is None else self._filter.bits
+
+    def _update_filter(self) -> int:
+        burst = self._burst
+        if len(burst) == 1:
+            self._filter.update(self._pcf.read(self._channel_number))
+        else:
+            self._filter.extend(self._pcf.read_burst(self._channel_number, burst))
+        return self._filter.value
 
     @property
     def voltage(self) -> float:
@@ -56,8 +110,12 @@ class AnalogIn:
 
         if not self._pcf:
             raise RuntimeError("Underlying ADC does not exist, likely due to calling `deinit`")
+        if self._filter is not None:
+            return self._update_filter() * self._scale
         raw_reading = self._pcf.read(self._channel_number)
-        return ((raw_reading << 8) / 65535) * self._pcf.reference_voltage
+        if self._table:
+            return self._table[raw_reading] * self._scale
+        return (raw_reading << 8) * self._scale
 
     @property
     def value(self) -> int:
@@ -67,8 +125,24 @@ class AnalogIn:
         if not self._pcf:
             raise RuntimeError("Underlying ADC does not exist, likely due to calling `deinit`")
 
+        if self._filter is not None:
+            return self._update_filter()
+        if self._table:
+            return self._table[self._pcf.read(self._channel_number)]
         return self._pcf.read(self._channel_number) << 8
 
+    async def avalue(self) -> int:
+        """Coroutine returning `value` without blocking the event loop while on the bus"""
+        from adafruit_pcf8591.aio import run_serialized  # noqa: PLC0415
+
+        return await run_serialized(self._pcf, type(self).value.fget, self)
+
+    async def avoltage(self) -> float:
+        """Coroutine returning `voltage` without blocking the event loop while on the bus"""
+        from adafruit_pcf8591.aio import run_serialized  # noqa: PLC0415
+
+        return await run_serialized(self._pcf, type(self).voltage.fget, self)
+
     @property
     def reference_voltage(self) -> float:
         """The maximum voltage measurable (also known as the reference voltage) as a float in
@@ -81,3 +155,155 @@ class AnalogIn:
     def deinit(self) -> None:
         """Release the reference to the PCF8591. Create a new AnalogIn to use it again."""
         self._pcf = None
+
+
+class DifferentialAnalogIn(AnalogIn):
+    """AnalogIn for a differential ADC channel, which reads as a signed value.
+
+    The input program must be set with `PCF8591.input_mode` before creating it. Filters work
+    on unsigned readings, so `filter` can't be set."""
+
+    __slots__ = ()
+
+    def __init__(self, pcf: PCF8591, pin: Literal[0, 1, 2]) -> None:
+        """DifferentialAnalogIn
+
+        :param pcf: The PCF8591 object.
+        :param int pin: Required ADC channel pin; must be differential in ``pcf.input_mode``
+
+        """
+        if not pcf.is_differential(pin):
+            raise ValueError("pin must be a differential channel in the current input_mode")
+        super().__init__(pcf, pin)
+
+    def _read_signed(self) -> int:
+        if not self._pcf:
+            raise RuntimeError("Underlying ADC does not exist, likely due to calling `deinit`")
+        raw_reading = self._pcf.read(self._channel_number)
+        if raw_reading > 127:
+            raw_reading -= 256
+        return raw_reading
+
+    @AnalogIn.filter.setter
+    def filter(self, new_filter: Filter | None) -> None:
+        if new_filter is not None:
+            raise ValueError("filters are not supported on differential channels")
+        AnalogIn.filter.fset(self, new_filter)
+
+    @property
+    def voltage(self) -> float:
+        """Returns the difference between the channel's inputs in volts, from
+        -`AnalogIn.reference_voltage` / 2 to +`AnalogIn.reference_voltage` / 2."""
+        return (self._read_signed() << 8) * self._scale
+
+    @property
+    def value(self) -> int:
+        """Returns the difference between the channel's inputs.
+        The value is scaled to a signed 16-bit integer from the native signed 8-bit value."""
+        return self._read_signed() << 8
+
+
+class AnalogInGroup:
+    """Several ADC channels of a `PCF8591` read together. Each access of `values` or
+    `voltages` reads every channel in a single I2C transaction with `PCF8591.read_all` and
+    fills an array allocated when the group was created. Differential channels in the current
+    ``input_mode`` read as signed values.
+
+    .. code-block:: python
+
+        group = AnalogInGroup(pcf, (A0, A1, A3))
+        a0, a1, a3 = group.voltages
+
+    :param ~adafruit_pcf8591.pcf8591.PCF8591 pcf: The PCF8591 to read
+    :param pins: The ADC channels, in the order their readings are returned. Default is every
+        channel of the current ``input_mode``
+    """
+
+    __slots__ = (
+        "_calibration",
+        "_pcf",
+        "_pins",
+        "_scale",
+        "_scan",
+        "_signed",
+        "_tables",
+        "_values",
+        "_voltages",
+    )
+
+    def __init__(self, pcf: PCF8591, pins: typing.Sequence[int] | None = None) -> None:
+        count = pcf.channel_count
+        if pins is None:
+            pins = range(count)
+        for pin in pins:
+            if pin < 0 or pin >= count:
+                raise ValueError(f"pin must be from 0-{count - 1}")
+        self._pcf = pcf
+        self._pins = bytes(pins)
+        self._signed = bytes(pcf.is_differential(pin) for pin in self._pins)
+        self._scale = pcf.reference_voltage / 65535
+        self._scan = bytearray(count)
+        self._values = array("i", bytes(4 * len(self._pins)))
+        self._voltages = array("f", bytes(4 * len(self._pins)))
+        self._tables = [None] * len(self._pins)
+        self.calibration = pcf.calibration
+
+    @property
+    def pins(self) -> bytes:
+        """The ADC channels in the group"""
+        return self._pins
+
+    @property
+    def calibration(self) -> Calibration | None:
+        """The `Calibration` applied to the single-ended channels, or None. Defaults to the
+        `PCF8591.calibration` at the time the group was created"""
+        return self._calibration
+
+    @calibration.setter
+    def calibration(self, calibration: Calibration | None) -> None:
+        self._calibration = calibration
+        for index, pin in enumerate(self._pins):
+            if calibration is None or self._signed[index]:
+                self._tables[index] = None
+            else:
+                self._tables[index] = calibration.channel_table(pin)
+
+    def _read(self) -> array:
+        if not self._pcf:
+            raise RuntimeError("Underlying ADC does not exist, likely due to calling `deinit`")
+        scan = self._pcf.read_all(self._scan)
+        values = self._values
+        for index, pin in enumerate(self._pins):
+            raw_reading = scan[pin]
+            table = self._tables[index]
+            if table:
+                values[index] = table[raw_reading]
+            elif self._signed[index] and raw_reading > 127:
+                values[index] = (raw_reading - 256) << 8
+            else:
+                values[index] = raw_reading << 8
+        return values
+
+    @property
+    def values(self) -> array:
+        """The 16-bit value of each channel, as returned by `AnalogIn.value`. The same array is
+        refilled by every access"""
+        return self._read()
+
+    @property
+    def voltages(self) -> array:
+        """The voltage of each channel, as returned by `AnalogIn.voltage`. The same array is
+        refilled by every access"""
+        values = self._read()
+        voltages = self._voltages
+        scale = self._scale
+        for index in range(len(values)):
+            voltages[index] = values[index] * scale
+        return voltages
+
+    def __len__(self) -> int:
+        return len(self._pins)
+
+    def deinit(self) -> None:
+        """Release the reference to the PCF8591. Create a new AnalogInGroup to use it again."""
+        self._pcf = None
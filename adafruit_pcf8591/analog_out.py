@@ -27,19 +27,23 @@ AnalogOut for setting the included DAC to a given voltage.
 * Author(s): Bryan Siepert
 """
 
-try:
-    import typing
+from __future__ import annotations
 
-    from typing_extensions import Literal
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Literal
 
+    from circuitpython_typing import ReadableBuffer
+
+    from adafruit_pcf8591.calibration import Calibration
     from adafruit_pcf8591.pcf8591 import PCF8591
-except ImportError:
-    pass
 
 
 class AnalogOut:
     """AnalogIn Mock Implementation for ADC Reads."""
 
+    __slots__ = ("_calibration", "_pcf", "_pin_setting", "_table", "_value")
+
     def __init__(self, pcf: PCF8591, dac_pin: Literal[0] = 0) -> None:
         """AnalogIn
 
@@ -51,8 +55,21 @@ class AnalogOut:
         if dac_pin != 0:
             raise AttributeError("DAC pin must be adafruit_pcf8591.pcf8591.DAC_PIN")
         self._pin_setting = dac_pin
+        self._table = None
+        self.calibration = pcf.calibration
         self._pcf.dac_enabled = True
 
+    @property
+    def calibration(self) -> Calibration | None:
+        """The `Calibration` applied to `value`, or None. Defaults to the
+        `PCF8591.calibration` at the time the AnalogOut was created"""
+        return self._calibration
+
+    @calibration.setter
+    def calibration(self, calibration: Calibration | None) -> None:
+        self._calibration = calibration
+        self._table = None if calibration is None else calibration.dac_table
+
     @property
     def value(self) -> int:
         """Returns the currently set value of the DAC pin as an integer."""
@@ -66,9 +83,34 @@ class AnalogOut:
         if not self._pcf.dac_enabled:
             raise RuntimeError("Underlying DAC is disabled, likely due to calling `deinit`")
         # underlying sensor is 8-bit, so scale accordingly
-        self._pcf.write(new_value >> 8)
+        if self._table:
+            self._pcf.write(self._table[new_value >> 8])
+        else:
+            self._pcf.write(new_value >> 8)
         self._value = new_value
 
+    async def aset(self, new_value: int) -> None:
+        """Coroutine that sets `value` without blocking the event loop while on the bus
+
+        :param int new_value: The value to set, from 0-65535
+        """
+        from adafruit_pcf8591.aio import run_serialized  # noqa: PLC0415
+
+        await run_serialized(self._pcf, type(self).value.fset, self, new_value)
+
+    def write_samples(self, buffer: ReadableBuffer, loops: int = 1) -> None:
+        """Play a waveform on the DAC pin by streaming a buffer of samples
+
+        :param buffer: The samples to output. Unlike `value`, each sample is a single byte
+            in the native 8-bit range of the DAC, 0-255
+        :param int loops: The number of times to play the whole buffer
+        """
+        if not self._pcf.dac_enabled:
+            raise RuntimeError("Underlying DAC is disabled, likely due to calling `deinit`")
+        self._pcf.write_stream(buffer, loops)
+        if len(buffer):
+            self._value = buffer[-1] << 8
+
     def deinit(self) -> None:
         """Disable the underlying DAC and release the reference to the PCF8591.
         Create a new AnalogOut to use it again."""
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`buffered_out`
+================================================================================
+
+A write-behind `AnalogOut` that skips DAC writes which wouldn't change the output and
+coalesces rapid updates.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* The background flusher started by `BufferedAnalogOut.start` uses the ``threading`` module,
+  so it is only supported on Linux with Adafruit Blinka. The rest works on CircuitPython.
+"""
+
+from __future__ import annotations
+
+import time
+
+from adafruit_pcf8591.analog_out import AnalogOut
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from circuitpython_typing import ReadableBuffer
+
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+# no DAC code is pending or known to have been written
+_NONE = -1
+
+
+class BufferedAnalogOut(AnalogOut):
+    """An `AnalogOut` that only writes to the DAC when its 8-bit output changes, and at most
+    `max_rate` times a second.
+
+    Setting `value` to a value with the same 8-bit code as the one last written does nothing.
+    Otherwise the new code is written straight away if the last write was at least
+    1 / `max_rate` seconds ago, or kept pending if not; a pending code is replaced by later
+    values, so only the latest is written. Pending codes are written by the next set of `value`
+    after the interval, by `flush`, or by a flusher: `start` runs one in a background thread
+    and `arun` is the asyncio version. While a flusher runs, setting `value` never writes.
+
+    .. code-block:: python
+
+        dac = BufferedAnalogOut(pcf, max_rate=100)
+        dac.start()
+        while True:
+            dac.value = controller.update()
+        print(dac.writes, dac.suppressed, dac.coalesced)
+
+    :param ~adafruit_pcf8591.pcf8591.PCF8591 pcf: The PCF8591 of the DAC
+    :param int dac_pin: Required pin must be adafruit_pcf8591.pcf8591.OUT
+    :param float max_rate: The most writes per second, or None for no limit
+    """
+
+    __slots__ = (
+        "_interval",
+        "_last_write",
+        "_lock",
+        "_pending",
+        "_running",
+        "_sent",
+        "_thread",
+        "coalesced",
+        "error",
+        "suppressed",
+        "writes",
+    )
+
+    def __init__(self, pcf: PCF8591, dac_pin: int = 0, max_rate: float | None = None) -> None:
+        super().__init__(pcf, dac_pin)
+        self._interval = 0
+        self.max_rate = max_rate
+        self._pending = _NONE
+        # enabling the DAC above wrote the driver's current code
+        self._sent = pcf._dacval
+        self._last_write = 0
+        self._lock = None
+        self._thread = None
+        self._running = False
+        self.writes = 0
+        """The number of values written to the DAC"""
+        self.suppressed = 0
+        """The number of values set that were skipped as the DAC already had their 8-bit code"""
+        self.coalesced = 0
+        """The number of pending values replaced by a later value before being written"""
+        self.error = None
+        """The exception that stopped the last flusher, or None. After a failure, setting
+        `value` writes straight away again, so later errors are raised to the caller"""
+
+    @property
+    def max_rate(self) -> float | None:
+        """The most writes to the DAC per second, or None for no limit"""
+        return 1_000_000_000 / self._interval if self._interval else None
+
+    @max_rate.setter
+    def max_rate(self, max_rate: float | None) -> None:
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("max_rate must be greater than 0")
+        self._interval = int(1_000_000_000 / max_rate) if max_rate else 0
+
+    @property
+    def value(self) -> int:
+        """The last value set, which may still be pending. Setting it only writes to the DAC
+        when the 8-bit code changes and `max_rate` allows"""
+        return self._value
+
+    @value.setter
+    def value(self, new_value: int) -> None:
+        if new_value < 0 or new_value > 65535:
+            raise ValueError("value must be a 16-bit integer from 0-65535")
+        if not self._pcf or not self._pcf.dac_enabled:
+            raise RuntimeError("Underlying DAC is disabled, likely due to calling `deinit`")
+        code = self._table[new_value >> 8] if self._table else new_value >> 8
+        self._value = new_value
+        lock = self._lock
+        if lock:
+            lock.acquire()
+        if self._pending != _NONE:
+            if code == self._pending:
+                self.suppressed += 1
+            else:
+                self.coalesced += 1
+                self._pending = code if code != self._sent else _NONE
+        elif code == self._sent:
+            self.suppressed += 1
+        else:
+            self._pending = code
+        if lock:
+            lock.release()
+        if not self._running and time.monotonic_ns() - self._last_write >= self._interval:
+            self.flush()
+
+    @property
+    def pending(self) -> bool:
+        """True when a value is waiting to be written"""
+        return self._pending != _NONE
+
+    def flush(self) -> bool:
+        """Write the pending value now, regardless of `max_rate`
+
+        :return: True if a value was written
+        """
+        lock = self._lock
+        if lock:
+            lock.acquire()
+        code = self._pending
+        self._pending = _NONE
+        if lock:
+            lock.release()
+        if code == _NONE:
+            return False
+        self._pcf.write(code)
+        self._sent = code
+        self._last_write = time.monotonic_ns()
+        self.writes += 1
+        return True
+
+    def write_samples(self, buffer: ReadableBuffer, loops: int = 1) -> None:
+        """Play a waveform on the DAC pin by streaming a buffer of samples, dropping any
+        pending value
+
+        :param buffer: The samples to output, one byte each, 0-255
+        :param int loops: The number of times to play the whole buffer
+        """
+        self._pending = _NONE
+        super().write_samples(buffer, loops)
+        if len(buffer):
+            self._sent = buffer[-1]
+
+    def _flush_interval(self) -> float:
+        if not self._interval:
+            raise ValueError("max_rate must be set to run a flusher")
+        return self._interval / 1_000_000_000
+
+    def start(self) -> None:
+        """Start a background thread that writes the pending value every 1 / `max_rate`
+        seconds"""
+        import threading  # noqa: PLC0415
+
+        interval = self._flush_interval()
+        if self._running:
+            return
+        if self._thread is not None:
+            self._thread.join()
+        self.error = None
+        self._lock = threading.Lock()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def _run(self, interval: float) -> None:
+        try:
+            while self._running:
+                self.flush()
+                time.sleep(interval)
+        except Exception as error:
+            self.error = error
+            raise
+        finally:
+            self._running = False
+
+    async def arun(self) -> None:
+        """Write the pending value every 1 / `max_rate` seconds until `stop` is called,
+        without blocking the event loop while on the bus"""
+        import asyncio  # noqa: PLC0415
+
+        interval = self._flush_interval()
+        self.error = None
+        self._running = True
+        try:
+            while self._running:
+                await self._aflush()
+                await asyncio.sleep(interval)
+        except Exception as error:
+            self.error = error
+            raise
+        finally:
+            self._running = False
+
+    async def _aflush(self) -> None:
+        from adafruit_pcf8591.aio import run_serialized  # noqa: PLC0415
+
+        code = self._pending
+        if code == _NONE:
+            return
+        self._pending = _NONE
+        await run_serialized(self._pcf, self._pcf.write, code)
+        self._sent = code
+        self._last_write = time.monotonic_ns()
+        self.writes += 1
+
+    def stop(self) -> None:
+        """Stop the flusher started by `start` or `arun`, then write any pending value"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self._lock = None
+        self.flush()
+
+    def deinit(self) -> None:
+        """Stop any flusher, write any pending value, then disable the underlying DAC"""
+        self.stop()
+        super().deinit()
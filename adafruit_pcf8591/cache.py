@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`cache`
+================================================================================
+
+A cache of PCF8591 ADC readings shared by everything reading the same device.
+
+* Author(s): Adafruit Industries
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from circuitpython_typing import WriteableBuffer
+
+    from adafruit_pcf8591.calibration import Calibration
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+
+class ReadingCache:
+    """Caches the readings of a `PCF8591` for a maximum age per channel.
+
+    Reading a channel whose cached reading is older than its maximum age is a miss: every
+    channel is read in a single transaction with `PCF8591.read_all` and the cache is refilled.
+    Readings younger than their maximum age are hits and don't access the bus, so readers
+    within the same window share one acquisition.
+
+    The cache can be passed to `AnalogIn`, `DifferentialAnalogIn` and `AnalogInGroup` in place
+    of the `PCF8591`.
+
+    .. code-block:: python
+
+        cache = ReadingCache(pcf, max_age=0.01)
+        light = AnalogIn(cache, A0)
+        also_light = AnalogIn(cache, A0)
+        print(light.value, also_light.value, cache.hits, cache.misses)
+
+    :param ~adafruit_pcf8591.pcf8591.PCF8591 pcf: The PCF8591 to read
+    :param max_age: The longest time in seconds a reading is returned from the cache, for
+        every channel, or a sequence with one age per channel. Default is 0.01
+    """
+
+    def __init__(self, pcf: PCF8591, max_age: float | typing.Sequence[float] = 0.01) -> None:
+        self._pcf = pcf
+        self._readings = bytearray(4)
+        self._max_age = array("q", bytes(32))
+        ages = (max_age,) * 4 if isinstance(max_age, (int, float)) else tuple(max_age)
+        if len(ages) != 4:
+            raise ValueError("max_age must have an age for each of the 4 channels")
+        for channel, age in enumerate(ages):
+            self.set_max_age(channel, age)
+        # the time the readings were taken, and the input mode they were taken in
+        self._timestamp = 0
+        self._input_mode = -1
+        self.hits = 0
+        """The number of readings returned from the cache"""
+        self.misses = 0
+        """The number of readings that refilled the cache"""
+
+    def set_max_age(self, channel: int, max_age: float) -> None:
+        """Set the longest time a reading of one channel is returned from the cache
+
+        :param int channel: The ADC channel, 0 thru 3
+        :param float max_age: The age in seconds; 0 reads the channel every time
+        """
+        if channel < 0 or channel > 3:
+            raise ValueError("channel must be from 0-3")
+        if max_age < 0:
+            raise ValueError("max_age must not be negative")
+        self._max_age[channel] = int(max_age * 1_000_000_000)
+
+    def max_age(self, channel: int) -> float:
+        """The longest time in seconds a reading of a channel is returned from the cache
+
+        :param int channel: The ADC channel, 0 thru 3
+        """
+        return self._max_age[channel] / 1_000_000_000
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of readings returned from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset_stats(self) -> None:
+        """Set `hits` and `misses` back to zero"""
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self) -> None:
+        """Drop the cached readings, so the next read of every channel is a miss"""
+        self._input_mode = -1
+
+    def _refresh(self, now: int) -> None:
+        pcf = self._pcf
+        pcf.read_all(self._readings)
+        self._timestamp = now
+        self._input_mode = pcf.input_mode
+
+    def read(self, channel: int) -> int:
+        """The reading of a channel, from the cache when it's fresh enough
+
+        :param int channel: The ADC channel to read from, 0 thru `channel_count` - 1
+        """
+        pcf = self._pcf
+        if channel < 0 or channel >= pcf.channel_count:
+            raise ValueError(f"channel must be from 0-{pcf.channel_count - 1}")
+        now = time.monotonic_ns()
+        if self._input_mode != pcf.input_mode or now - self._timestamp > self._max_age[channel]:
+            self.misses += 1
+            self._refresh(now)
+        else:
+            self.hits += 1
+        return self._readings[channel]
+
+    def read_all(self, buffer: WriteableBuffer | None = None) -> WriteableBuffer:
+        """The readings of every channel, from the cache when they're all fresh enough. Counts
+        as one hit or miss
+
+        :param buffer: Optional buffer of at least `channel_count` bytes to fill. If not
+            given, a new ``bytearray`` is created
+        :return: The buffer holding the readings
+        """
+        pcf = self._pcf
+        count = pcf.channel_count
+        if buffer is None:
+            buffer = bytearray(count)
+        elif len(buffer) < count:
+            raise ValueError(f"buffer must hold at least {count} bytes")
+        now = time.monotonic_ns()
+        fresh = self._input_mode == pcf.input_mode
+        for channel in range(count):
+            if now - self._timestamp > self._max_age[channel]:
+                fresh = False
+        if fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._refresh(now)
+        for channel in range(count):
+            buffer[channel] = self._readings[channel]
+        return buffer
+
+    def read_burst(self, channel: int, buffer: WriteableBuffer) -> WriteableBuffer:
+        """Fill a buffer with consecutive readings of one ADC input straight from the
+        `PCF8591`, as used by `AnalogIn` filters. Bursts aren't cached"""
+        return self._pcf.read_burst(channel, buffer)
+
+    @property
+    def reference_voltage(self) -> float:
+        """The reference voltage of the `PCF8591`"""
+        return self._pcf.reference_voltage
+
+    @property
+    def calibration(self) -> Calibration | None:
+        """The calibration of the `PCF8591`"""
+        return self._pcf.calibration
+
+    @property
+    def input_mode(self) -> int:
+        """The input mode of the `PCF8591`"""
+        return self._pcf.input_mode
+
+    @property
+    def channel_count(self) -> int:
+        """The number of ADC channels of the `PCF8591`"""
+        return self._pcf.channel_count
+
+    def is_differential(self, channel: int) -> bool:
+        """True if the channel reads a differential input in the current input mode
+
+        :param int channel: The ADC channel
+        """
+        return self._pcf.is_differential(channel)
@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_pcf8591.calibration`
+================================================================================
+
+Per-channel ADC and DAC calibration for the PCF8591, compiled to lookup tables.
+
+* Author(s): Adafruit Industries
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from circuitpython_typing import ReadableBuffer
+
+_MAGIC = b"PCFC"
+_FORMAT_VERSION = 1
+# magic, format version, bitmask of the tables present, reference voltage
+_HEADER = "<4sBBf"
+_DAC_TABLE = 0x10
+
+
+def _interpolate(points: typing.Sequence[tuple[float, float]], x: float) -> float:
+    # piecewise linear through the points, extended past either end by the outer segments
+    if len(points) == 1:
+        return x + points[0][1] - points[0][0]
+    index = 1
+    while index < len(points) - 1 and x > points[index][0]:
+        index += 1
+    (x0, y0), (x1, y1) = points[index - 1], points[index]
+    return y0 + (x - x0) * (y1 - y0) / (x1 - x0)
+
+
+def _check_points(points: typing.Sequence[tuple[float, float]]) -> list:
+    points = sorted((float(x), float(y)) for x, y in points)
+    if not points:
+        raise ValueError("at least one calibration point is required")
+    for index in range(1, len(points)):
+        if points[index][0] == points[index - 1][0]:
+            raise ValueError("calibration points must have different readings")
+    return points
+
+
+class Calibration:
+    """Offset and gain corrections for the ADC channels and DAC output of a `PCF8591`.
+
+    Each correction is given as calibration points and compiled into a 256 entry lookup table,
+    one entry per possible 8-bit code, so applying it costs a single index operation. Assign
+    it to `PCF8591.calibration` before creating `AnalogIn` and `AnalogOut` objects to apply
+    it. Differential channels are not calibrated.
+
+    With one point the correction is an offset; with two or more the readings are
+    interpolated linearly between neighbouring points.
+
+    .. code-block:: python
+
+        calibration = Calibration(pcf.reference_voltage)
+        # the channel read 0.05V with 0V applied, and 3.2V with 3.3V applied
+        calibration.calibrate_channel(0, [(0.05, 0.0), (3.2, 3.3)])
+        pcf.calibration = calibration
+        with open("/calibration.bin", "wb") as file:
+            file.write(calibration.to_bytes())
+
+    :param float reference_voltage: The reference voltage of the PCF8591 being calibrated
+    """
+
+    def __init__(self, reference_voltage: float = 3.3) -> None:
+        self._reference_voltage = reference_voltage
+        self._channel_points = [None] * 4
+        self._channel_tables = [None] * 4
+        self._dac_points = None
+        self._dac_table = None
+
+    @property
+    def reference_voltage(self) -> float:
+        """The reference voltage the calibration was made with"""
+        return self._reference_voltage
+
+    def calibrate_channel(self, channel: int, points: typing.Sequence[tuple[float, float]]) -> None:
+        """Set the correction for an ADC channel
+
+        :param int channel: The single-ended ADC channel, 0 thru 3
+        :param points: Pairs of the voltage the channel read and the actual voltage applied
+        """
+        if channel < 0 or channel > 3:
+            raise ValueError("channel must be from 0-3")
+        points = _check_points(points)
+        scale = 65535 / self._reference_voltage
+        table = array("H", bytes(512))
+        for raw in range(256):
+            reading = ((raw << 8) / 65535) * self._reference_voltage
+            value = round(_interpolate(points, reading) * scale)
+            table[raw] = max(0, min(65535, value))
+        self._channel_points[channel] = points
+        self._channel_tables[channel] = table
+
+    def calibrate_dac(self, points: typing.Sequence[tuple[float, float]]) -> None:
+        """Set the correction for the DAC output
+
+        :param points: Pairs of the voltage requested from the DAC and the voltage measured at
+            its output
+        """
+        points = _check_points(points)
+        step = self._reference_voltage / 256
+        # the voltage measured for each code, then for each requested code the code whose
+        # measured voltage is closest to it
+        measured = [_interpolate(points, code * step) for code in range(256)]
+        table = bytearray(256)
+        code = 0
+        for requested in range(256):
+            target = requested * step
+            while code < 255 and abs(measured[code + 1] - target) <= abs(measured[code] - target):
+                code += 1
+            table[requested] = code
+        self._dac_points = points
+        self._dac_table = table
+
+    def channel_table(self, channel: int) -> array | None:
+        """The lookup table of corrected 16-bit values for each raw reading of a channel, or
+        None if the channel isn't calibrated
+
+        :param int channel: The single-ended ADC channel, 0 thru 3
+        """
+        return self._channel_tables[channel]
+
+    @property
+    def dac_table(self) -> bytearray | None:
+        """The lookup table of the 8-bit code to send for each requested DAC code, or None if
+        the DAC isn't calibrated"""
+        return self._dac_table
+
+    def to_bytes(self) -> bytes:
+        """The compiled lookup tables in a compact binary form for `from_bytes`"""
+        present = 0
+        for channel in range(4):
+            if self._channel_tables[channel] is not None:
+                present |= 1 << channel
+        if self._dac_table is not None:
+            present |= _DAC_TABLE
+        data = bytearray(
+            struct.pack(_HEADER, _MAGIC, _FORMAT_VERSION, present, self._reference_voltage)
+        )
+        for table in self._channel_tables:
+            if table is None:
+                continue
+            if sys.byteorder != "little":
+                swapped = array("H", table)
+                swapped.byteswap()
+                data.extend(bytes(swapped))
+            else:
+                data.extend(bytes(table))
+        if self._dac_table is not None:
+            data.extend(self._dac_table)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: ReadableBuffer) -> Calibration:
+        """Load a calibration saved with `to_bytes`. The tables are used as stored, so no
+        calibration points are needed or kept
+
+        :param data: The saved calibration
+        """
+        data = memoryview(data)
+        header_size = struct.calcsize(_HEADER)
+        if len(data) < header_size:
+            raise ValueError("data is too short to be a PCF8591 calibration")
+        magic, version, present, reference_voltage = struct.unpack_from(_HEADER, data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("data is not a PCF8591 calibration")
+        size = header_size + (256 if present & _DAC_TABLE else 0)
+        for channel in range(4):
+            if present & (1 << channel):
+                size += 512
+        if len(data) != size:
+            raise ValueError(f"calibration data must be {size} bytes, not {len(data)}")
+        calibration = cls(reference_voltage)
+        offset = header_size
+        for channel in range(4):
+            if present & (1 << channel):
+                table = array("H", bytes(data[offset : offset + 512]))
+                if sys.byteorder != "little":
+                    table.byteswap()
+                calibration._channel_tables[channel] = table
+                offset += 512
+        if present & _DAC_TABLE:
+            calibration._dac_table = bytearray(data[offset : offset + 256])
+        return calibration
+
+    def to_json(self) -> str:
+        """The calibration points as JSON, for `from_json`. A calibration loaded with
+        `from_bytes` has no points, so it can only be saved with `to_bytes`"""
+        tables = self._channel_tables + [self._dac_table]
+        points = self._channel_points + [self._dac_points]
+        for table, point in zip(tables, points):
+            if table is not None and point is None:
+                raise ValueError("calibration has tables without points; save it with to_bytes")
+        return json.dumps(
+            {
+                "reference_voltage": self._reference_voltage,
+                "channels": self._channel_points,
+                "dac": self._dac_points,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> Calibration:
+        """Load a calibration saved with `to_json`, compiling its lookup tables
+
+        :param str data: The saved calibration
+        """
+        settings = json.loads(data)
+        calibration = cls(settings["reference_voltage"])
+        for channel, points in enumerate(settings["channels"]):
+            if points:
+                calibration.calibrate_channel(channel, points)
+        if settings["dac"]:
+            calibration.calibrate_dac(settings["dac"])
+        return calibration
@@ -0,0 +1,403 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`capture`
+================================================================================
+
+Compact binary capture files of raw PCF8591 readings, for recording long captures and
+replaying them later, including into a `SimulatedPCF8591`.
+
+A capture file is a header followed by fixed-size blocks. The header holds the channels,
+input mode, sample rate, reference voltage and optional `Calibration`. Each block holds the
+``time.monotonic_ns()`` time of its first sample, the number of samples in it, and the raw
+8-bit readings interleaved by channel. Every block but the last is full, and the last is
+padded to full size, so blocks can be located without reading the ones before them.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* `CaptureReader` memory maps the file when ``mmap`` is available, and can return the
+  readings as a zero-copy ``numpy`` array when it is installed.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+from array import array
+
+from adafruit_pcf8591.calibration import Calibration
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+try:
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+
+    from adafruit_pcf8591.simulator import SimulatedPCF8591
+
+_MAGIC = b"PCFS"
+_FORMAT_VERSION = 1
+# magic, format version, input mode, channel count, sample rate, reference voltage,
+# samples per block, calibration size; followed by the channels and the calibration
+_HEADER = "<4sBBBxdfII"
+# time of the first sample in nanoseconds, number of samples
+_BLOCK_HEADER = "<qI"
+
+
+class CaptureWriter:
+    """Streams raw readings to a capture file.
+
+    Readings are collected in a block buffer allocated up front, and each block is written to
+    the file with a single write once it's full, so appending a sample only copies its bytes.
+
+    .. code-block:: python
+
+        with CaptureWriter("/capture.pcf", channels=(A0, A1), rate=100) as capture:
+            sample = bytearray(pcf.channel_count)
+            for _ in range(10000):
+                pcf.read_all(sample)
+                capture.append(sample)
+                time.sleep(0.01)
+
+    :param file: The path of the file to create, or a file opened for binary writing
+    :param channels: The ADC channels in each sample, in the order their readings are given
+    :param float rate: The nominal number of samples per second, used to time the samples
+        after the first of each block
+    :param float reference_voltage: The reference voltage of the `PCF8591` taking the readings
+    :param int input_mode: The ``input_mode`` of the `PCF8591` taking the readings. Default is
+        ``SINGLE_ENDED``
+    :param Calibration calibration: Optional calibration to store with the readings
+    :param int block_samples: The number of samples in each block. Default is 256
+    """
+
+    def __init__(
+        self,
+        file: str | typing.BinaryIO,
+        channels: typing.Sequence[int],
+        rate: float,
+        reference_voltage: float = 3.3,
+        input_mode: int = 0,
+        calibration: Calibration | None = None,
+        block_samples: int = 256,
+    ) -> None:
+        if not channels or len(channels) > 4:
+            raise ValueError("channels must have 1-4 channels")
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if block_samples < 1:
+            raise ValueError("block_samples must be at least 1")
+        self._channels = bytes(channels)
+        self._period = int(1_000_000_000 / rate)
+        self._block_samples = block_samples
+        self._data_offset = struct.calcsize(_BLOCK_HEADER)
+        self._block = bytearray(self._data_offset + block_samples * len(self._channels))
+        self._length = 0
+        self._timestamp = 0
+        self.sample_count = 0
+        """The number of samples appended"""
+
+        if isinstance(file, str):
+            file = open(file, "wb")
+            self._owns_file = True
+        else:
+            self._owns_file = False
+        self._file = file
+        stored = calibration.to_bytes() if calibration is not None else b""
+        file.write(
+            struct.pack(
+                _HEADER,
+                _MAGIC,
+                _FORMAT_VERSION,
+                input_mode,
+                len(self._channels),
+                rate,
+                reference_voltage,
+                block_samples,
+                len(stored),
+            )
+        )
+        file.write(self._channels)
+        file.write(stored)
+
+    def append(self, sample: ReadableBuffer, timestamp: int | None = None) -> None:
+        """Add one sample
+
+        :param sample: The raw readings of the channels, one byte each
+        :param int timestamp: The ``time.monotonic_ns()`` time the sample was taken. Only
+            stored for the first sample of a block. Default is now
+        """
+        width = len(self._channels)
+        if len(sample) < width:
+            raise ValueError("sample must have a reading for each channel")
+        if self._length == 0:
+            self._timestamp = time.monotonic_ns() if timestamp is None else timestamp
+        start = self._data_offset + self._length * width
+        self._block[start : start + width] = sample[:width]
+        self._length += 1
+        self.sample_count += 1
+        if self._length == self._block_samples:
+            self._write_block()
+
+    def extend(self, samples: ReadableBuffer, timestamp: int | None = None) -> None:
+        """Add a buffer of samples, such as the readings of `PCF8591.read_burst`
+
+        :param samples: The raw readings, interleaved by channel for more than one channel
+        :param int timestamp: The ``time.monotonic_ns()`` time the first sample was taken.
+            Later samples are timed at the nominal rate. Default is now
+        """
+        width = len(self._channels)
+        if len(samples) % width:
+            raise ValueError("samples must have a reading for each channel")
+        if timestamp is None:
+            timestamp = time.monotonic_ns()
+        samples = memoryview(samples)
+        index = 0
+        total = len(samples) // width
+        while index < total:
+            if self._length == 0:
+                self._timestamp = timestamp + index * self._period
+            count = min(self._block_samples - self._length, total - index)
+            start = self._data_offset + self._length * width
+            self._block[start : start + count * width] = samples[
+                index * width : (index + count) * width
+            ]
+            self._length += count
+            self.sample_count += count
+            index += count
+            if self._length == self._block_samples:
+                self._write_block()
+
+    def _write_block(self) -> None:
+        struct.pack_into(_BLOCK_HEADER, self._block, 0, self._timestamp, self._length)
+        self._file.write(self._block)
+        self._length = 0
+
+    def flush(self) -> None:
+        """Flush the blocks written so far to the file. A partly filled block is kept until
+        it fills or the writer is closed"""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the last block, padded to full size, and close the file if the writer
+        opened it"""
+        if self._file is None:
+            return
+        if self._length:
+            start = self._data_offset + self._length * len(self._channels)
+            self._block[start:] = bytes(len(self._block) - start)
+            self._write_block()
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+        self._file = None
+
+    def __enter__(self) -> CaptureWriter:
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
+
+
+class CaptureReader:
+    """Reads a capture file written by `CaptureWriter`.
+
+    The file is memory mapped where ``mmap`` is available, so blocks are read from it without
+    copying until they're used. A block left incomplete by a writer that wasn't closed is
+    ignored.
+
+    .. code-block:: python
+
+        with CaptureReader("/capture.pcf") as capture:
+            readings = capture.ndarray()[:, :, 0]  # blocks x samples of the first channel
+            for _ in capture.replay(simulated_pcf):
+                print(pcf.read(0))
+
+    :param str path: The path of the capture file
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        self._data = None
+        self.channels = b""
+        """The ADC channels in each sample"""
+        self.calibration = None
+        """The `Calibration` stored with the capture, or None"""
+        self.block_count = 0
+        """The number of complete blocks"""
+        self.sample_count = 0
+        """The number of samples in the complete blocks"""
+        try:
+            self._load()
+        except Exception:
+            self.close()
+            raise
+
+    def _load(self) -> None:
+        header_size = struct.calcsize(_HEADER)
+        if self._file.seek(0, 2) < header_size:
+            raise ValueError("file is too short to be a PCF8591 capture")
+        self._file.seek(0)
+        if mmap is not None:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._data = self._file.read()
+        (
+            magic,
+            version,
+            self.input_mode,
+            width,
+            self.rate,
+            self.reference_voltage,
+            self.block_samples,
+            stored,
+        ) = struct.unpack_from(_HEADER, self._data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("file is not a PCF8591 capture")
+        offset = header_size
+        if len(self._data) < offset + width + stored:
+            raise ValueError("capture file is truncated")
+        self.channels = bytes(self._data[offset : offset + width])
+        offset += width
+        if stored:
+            self.calibration = Calibration.from_bytes(self._data[offset : offset + stored])
+        self._offset = offset + stored
+        self._header_size = struct.calcsize(_BLOCK_HEADER)
+        self._block_size = self._header_size + self.block_samples * width
+        self.block_count = (len(self._data) - self._offset) // self._block_size
+        if self.block_count:
+            _, last = struct.unpack_from(_BLOCK_HEADER, self._data, self._block_offset(-1))
+            self.sample_count = (self.block_count - 1) * self.block_samples + last
+
+    def _block_offset(self, index: int) -> int:
+        if index < 0:
+            index += self.block_count
+        if index < 0 or index >= self.block_count:
+            raise IndexError("block index out of range")
+        return self._offset + index * self._block_size
+
+    @property
+    def period_ns(self) -> int:
+        """The nominal time between samples in nanoseconds"""
+        return int(1_000_000_000 / self.rate)
+
+    def block(self, index: int) -> tuple[int, memoryview]:
+        """The ``time.monotonic_ns()`` time of the first sample of a block, and a memoryview
+        of its readings, interleaved by channel, without copying them
+
+        :param int index: The index of the block
+        """
+        offset = self._block_offset(index)
+        timestamp, length = struct.unpack_from(_BLOCK_HEADER, self._data, offset)
+        start = offset + self._header_size
+        return timestamp, memoryview(self._data)[start : start + length * len(self.channels)]
+
+    def timestamps(self) -> array:
+        """The time of the first sample of each block"""
+        times = array("q", bytes(8 * self.block_count))
+        for index in range(self.block_count):
+            times[index] = struct.unpack_from(_BLOCK_HEADER, self._data, self._block_offset(index))[
+                0
+            ]
+        return times
+
+    def samples(self, channel: int, out: WriteableBuffer | None = None) -> WriteableBuffer:
+        """Copy the readings of one channel into a buffer
+
+        :param int channel: The ADC channel, which must be one of `channels`
+        :param out: Optional buffer of at least `sample_count` bytes to fill. If not given, a
+            new ``array`` is created
+        :return: The readings
+        """
+        if channel not in self.channels:
+            raise ValueError("channel was not captured")
+        position = self.channels.index(channel)
+        width = len(self.channels)
+        if out is None:
+            out = array("B", bytes(self.sample_count))
+        elif len(out) < self.sample_count:
+            raise ValueError("out must be at least sample_count long")
+        target = memoryview(out)
+        filled = 0
+        for index in range(self.block_count):
+            readings = self.block(index)[1]
+            count = len(readings) // width
+            target[filled : filled + count] = readings[position::width]
+            filled += count
+        return out
+
+    def ndarray(self) -> typing.Any:
+        """The readings as a ``numpy`` array of blocks x ``block_samples`` samples x channels,
+        sharing memory with the file. The end of the last block is padding; `sample_count`
+        readings are valid. The array must be deleted before the reader is closed"""
+        if np is None:
+            raise RuntimeError("numpy is required for ndarray")
+        width = len(self.channels)
+        return np.ndarray(
+            (self.block_count, self.block_samples, width),
+            dtype=np.uint8,
+            buffer=self._data,
+            offset=self._offset + self._header_size,
+            strides=(self._block_size, width, 1),
+        )
+
+    def replay(
+        self, device: SimulatedPCF8591, loop: bool = False
+    ) -> typing.Iterator[tuple[int, int]]:
+        """Step a simulated PCF8591's inputs through the captured readings. Each step sets the
+        inputs of the captured channels to the next sample, then yields its index and
+        recorded time. Only captures of single-ended channels can be replayed
+
+        :param SimulatedPCF8591 device: The simulated device to drive
+        :param bool loop: True to start again from the first sample after the last
+        """
+        if self.input_mode:
+            raise ValueError("only single-ended captures can be replayed")
+        channels = self.channels
+        width = len(channels)
+        period = self.period_ns
+        inputs = device.inputs
+        while True:
+            sample_index = 0
+            for index in range(self.block_count):
+                timestamp, readings = self.block(index)
+                for position in range(len(readings) // width):
+                    start = position * width
+                    for offset in range(width):
+                        inputs[channels[offset]] = readings[start + offset]
+                    yield sample_index, timestamp + position * period
+                    sample_index += 1
+            if not loop or not sample_index:
+                return
+
+    def close(self) -> None:
+        """Unmap and close the file"""
+        if mmap is not None and self._data is not None:
+            self._data.close()
+        self._data = None
+        self._file.close()
+
+    def __enter__(self) -> CaptureReader:
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
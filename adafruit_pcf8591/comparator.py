@@ -0,0 +1,225 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`comparator`
+================================================================================
+
+Threshold and window comparators for PCF8591 ADC channels that report only state changes.
+
+* Author(s): Adafruit Industries
+"""
+
+from __future__ import annotations
+
+import time
+
+from micropython import const
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+# Comparator states
+BELOW = const(-1)
+INSIDE = const(0)
+ABOVE = const(1)
+
+
+class Comparator:
+    """Watches ADC channels of a `PCF8591` against low/high thresholds.
+
+    Every `poll` reads all channels with a single `PCF8591.read_all` and compares the watched
+    ones against their window. A channel is ``ABOVE`` once it reads higher than ``high`` and
+    ``BELOW`` once it reads lower than ``low``, and only returns to ``INSIDE`` after moving back
+    past the threshold by ``hysteresis``. Changes of state are passed to ``callback`` and
+    queued for `get_event`; readings that don't change the state cost nothing more than the
+    read.
+
+    The time `run` waits between polls adapts: `slow_interval` while every channel is more
+    than `margin` away from its thresholds, and `fast_interval` otherwise.
+
+    `run` can be called directly, as the target of a ``threading.Thread`` on Linux, and
+    `arun` is its asyncio version.
+
+    .. code-block:: python
+
+        comparator = Comparator(pcf, callback=print)
+        comparator.set_window(A0, low=20, high=200, hysteresis=4)
+        comparator.run()
+
+    :param ~adafruit_pcf8591.pcf8591.PCF8591 pcf: The PCF8591 to watch.
+    :param callback: Optional function called with the channel, the old state, the new state
+        and the raw reading whenever a channel changes state
+    :param int max_events: The number of events queued for `get_event` before the oldest are
+        dropped. Default is 32
+    """
+
+    def __init__(
+        self,
+        pcf: PCF8591,
+        callback: typing.Callable[[int, int, int, int], None] | None = None,
+        max_events: int = 32,
+    ) -> None:
+        self._pcf = pcf
+        self.callback = callback
+        """Function called on each change of state, or None"""
+        self._low = [0] * 4
+        self._high = [0] * 4
+        self._hysteresis = [0] * 4
+        self._watched = []
+        # None until the first reading of a channel sets its state without an event
+        self._states = [None] * 4
+        self._scan = bytearray(4)
+        self._events = []
+        self._max_events = max_events
+        self.dropped_events = 0
+        """The number of events dropped because the queue was full"""
+        self.slow_interval = 0.1
+        """Seconds between polls while all channels are away from their thresholds"""
+        self.fast_interval = 0.005
+        """Seconds between polls while a channel is near a threshold"""
+        self.margin = 8
+        """How near, in raw counts, a reading must be to a threshold to poll quickly"""
+        self._near = True
+        self._running = False
+
+    def set_window(self, channel: int, low: int, high: int, hysteresis: int = 0) -> None:
+        """Watch a channel. Readings are raw 8-bit values, or -128 to 127 for differential
+        channels. For a single threshold, set ``low`` to the lowest possible reading or
+        ``high`` to the highest
+
+        :param int channel: The ADC channel to watch
+        :param int low: The reading below which the channel is ``BELOW``
+        :param int high: The reading above which the channel is ``ABOVE``
+        :param int hysteresis: How far a reading must move back past a threshold to return
+            to ``INSIDE``
+        """
+        count = self._pcf.channel_count
+        if channel < 0 or channel >= count:
+            raise ValueError(f"channel must be from 0-{count - 1}")
+        if low > high:
+            raise ValueError("low must not be greater than high")
+        if hysteresis < 0:
+            raise ValueError("hysteresis must not be negative")
+        self._low[channel] = low
+        self._high[channel] = high
+        self._hysteresis[channel] = hysteresis
+        self._states[channel] = None
+        if channel not in self._watched:
+            self._watched.append(channel)
+
+    def clear_window(self, channel: int) -> None:
+        """Stop watching a channel
+
+        :param int channel: The ADC channel to stop watching
+        """
+        if channel in self._watched:
+            self._watched.remove(channel)
+            self._states[channel] = None
+
+    def state(self, channel: int) -> int | None:
+        """The current state of a watched channel: ``BELOW``, ``INSIDE`` or ``ABOVE``, or None
+        before it has been read
+
+        :param int channel: The ADC channel
+        """
+        return self._states[channel]
+
+    @property
+    def interval(self) -> float:
+        """The time `run` waits before the next poll, in seconds"""
+        return self.fast_interval if self._near else self.slow_interval
+
+    def get_event(self) -> tuple[int, int, int, int] | None:
+        """Remove and return the oldest queued event as a tuple of the channel, the old
+        state, the new state and the raw reading, or None when there are none"""
+        if not self._events:
+            return None
+        return self._events.pop(0)
+
+    def poll(self) -> int:
+        """Read the channels once and handle any changes of state
+
+        :return: The number of channels that changed state
+        """
+        self._pcf.read_all(self._scan)
+        return self._compare()
+
+    def _compare(self) -> int:
+        changes = 0
+        near = False
+        for channel in self._watched:
+            reading = self._scan[channel]
+            if reading > 127 and self._pcf.is_differential(channel):
+                reading -= 256
+            low = self._low[channel]
+            high = self._high[channel]
+            hysteresis = self._hysteresis[channel]
+            old = self._states[channel]
+
+            if reading > high:
+                new = ABOVE
+            elif reading < low:
+                new = BELOW
+            elif old == ABOVE and reading > high - hysteresis:
+                new = ABOVE
+            elif old == BELOW and reading < low + hysteresis:
+                new = BELOW
+            else:
+                new = INSIDE
+
+            if reading >= high - self.margin or reading <= low + self.margin:
+                near = True
+            if old is None:
+                self._states[channel] = new
+            elif new != old:
+                self._states[channel] = new
+                changes += 1
+                self._event(channel, old, new, reading)
+        self._near = near
+        return changes
+
+    def _event(self, channel: int, old: int, new: int, reading: int) -> None:
+        if self.callback is not None:
+            self.callback(channel, old, new, reading)
+        if len(self._events) >= self._max_events:
+            self._events.pop(0)
+            self.dropped_events += 1
+        self._events.append((channel, old, new, reading))
+
+    def run(self, duration: float | None = None) -> None:
+        """Poll repeatedly, waiting `interval` between polls, until `stop` is called or for
+        ``duration`` seconds
+
+        :param float duration: How long to run for in seconds, or None to run until stopped
+        """
+        self._running = True
+        end = None if duration is None else time.monotonic() + duration
+        while self._running and (end is None or time.monotonic() < end):
+            self.poll()
+            time.sleep(self.interval)
+        self._running = False
+
+    async def arun(self, duration: float | None = None) -> None:
+        """asyncio version of `run`; the reads don't block the event loop
+
+        :param float duration: How long to run for in seconds, or None to run until stopped
+        """
+        import asyncio  # noqa: PLC0415
+
+        from adafruit_pcf8591.aio import run_serialized  # noqa: PLC0415
+
+        self._running = True
+        end = None if duration is None else time.monotonic() + duration
+        while self._running and (end is None or time.monotonic() < end):
+            await run_serialized(self._pcf, self._pcf.read_all, self._scan)
+            self._compare()
+            await asyncio.sleep(self.interval)
+        self._running = False
+
+    def stop(self) -> None:
+        """Stop `run` or `arun` after the current poll"""
+        self._running = False
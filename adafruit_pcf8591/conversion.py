@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`conversion`
+================================================================================
+
+Bulk conversion of raw 8-bit PCF8591 readings, such as those from `PCF8591.read_burst`, to
+the scaled values and voltages returned by `AnalogIn`.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Uses ``ulab.numpy`` on CircuitPython or ``numpy`` on Linux when installed and the output is
+  an ``ndarray``. Otherwise each reading is converted with a 256 entry lookup table.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+try:
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from circuitpython_typing import ReadableBuffer
+
+if np is not None:
+    # ulab only has a single float type
+    _FLOAT = np.float64 if hasattr(np, "float64") else np.float
+
+# lookup tables, built on first use, keyed by signed and, for voltages, the reference voltage
+_tables = {}
+# bytes per item of each table typecode, as CircuitPython arrays have no itemsize
+_ITEM_SIZES = {"h": 2, "H": 2, "f": 4}
+
+
+def _table(typecode: str, signed: bool, scale: float = 0) -> array:
+    key = (typecode, signed, scale)
+    table = _tables.get(key)
+    if table is None:
+        table = array(typecode, bytes(256 * _ITEM_SIZES[typecode]))
+        for raw in range(256):
+            reading = raw - 256 if signed and raw > 127 else raw
+            table[raw] = (reading << 8) * scale if scale else reading << 8
+        _tables[key] = table
+    return table
+
+
+def _use_numpy(out: typing.Any) -> bool:
+    return np is not None and (out is None or isinstance(out, np.ndarray))
+
+
+def _convert(raw: ReadableBuffer, out: typing.Any, table: array) -> typing.Any:
+    if len(out) < len(raw):
+        raise ValueError("out must be at least as long as raw")
+    for index in range(len(raw)):
+        out[index] = table[raw[index]]
+    return out
+
+
+def values(raw: ReadableBuffer, out: typing.Any | None = None, signed: bool = False) -> typing.Any:
+    """Convert raw 8-bit readings to 16-bit values, as returned by `AnalogIn.value`
+
+    :param raw: The raw readings, one byte each
+    :param out: Optional ``array`` or ``ndarray`` to hold the values, at least as long as
+        ``raw``. If not given, a new ``ndarray`` is created when (ulab) numpy is available,
+        otherwise a new ``array``
+    :param bool signed: True for readings of a differential channel, which are two's
+        complement and convert to signed values, as returned by `DifferentialAnalogIn.value`
+    :return: The values
+    """
+    if _use_numpy(out):
+        readings = np.frombuffer(raw, dtype=np.int8 if signed else np.uint8)
+        result = np.array(readings, dtype=np.int16 if signed else np.uint16) * 256
+        if out is None:
+            return result
+        out[: len(result)] = result
+        return out
+    typecode = "h" if signed else "H"
+    if out is None:
+        out = array(typecode, bytes(len(raw) * 2))
+    return _convert(raw, out, _table(typecode, signed))
+
+
+def voltages(
+    raw: ReadableBuffer,
+    reference_voltage: float,
+    out: typing.Any | None = None,
+    signed: bool = False,
+) -> typing.Any:
+    """Convert raw 8-bit readings to voltages, as returned by `AnalogIn.voltage`
+
+    :param raw: The raw readings, one byte each
+    :param float reference_voltage: The reference voltage of the `PCF8591` that took the
+        readings
+    :param out: Optional ``array`` or ``ndarray`` of floats to hold the voltages, at least as
+        long as ``raw``. If not given, a new ``ndarray`` is created when (ulab) numpy is
+        available, otherwise a new ``array``
+    :param bool signed: True for readings of a differential channel, as with `values`
+    :return: The voltages
+    """
+    scale = reference_voltage / 65535
+    if _use_numpy(out):
+        readings = np.frombuffer(raw, dtype=np.int8 if signed else np.uint8)
+        result = np.array(readings, dtype=_FLOAT) * (256 * scale)
+        if out is None:
+            return result
+        out[: len(result)] = result
+        return out
+    if out is None:
+        out = array("f", bytes(len(raw) * 4))
+    return _convert(raw, out, _table("f", signed, scale))
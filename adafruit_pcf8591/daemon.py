@@ -0,0 +1,634 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`daemon`
+================================================================================
+
+An acquisition daemon that owns PCF8591 devices and shares their readings with other
+processes through shared memory, with a Unix socket for control commands.
+
+The daemon samples every channel of its devices at a fixed rate and publishes the latest
+readings and a ring buffer of history into a ``multiprocessing.shared_memory`` segment.
+Writes are guarded by a seqlock: a counter that is odd while the segment is being updated,
+so readers retry rather than lock. Clients map the segment once, after which each reading is
+a plain memory access, with no copies or system calls.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* This module uses ``multiprocessing.shared_memory``, ``socket`` and ``threading``, so it is
+  only supported on Linux with Adafruit Blinka, not on CircuitPython boards.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import selectors
+import socket
+import struct
+import threading
+import time
+from array import array
+from multiprocessing import shared_memory
+
+from adafruit_pcf8591.pcf8591 import _CHANNEL_COUNTS, _DIFFERENTIAL_CHANNELS
+from adafruit_pcf8591.scheduler import _next_deadline
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from circuitpython_typing import WriteableBuffer
+
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+_MAGIC = b"PCFD"
+_FORMAT_VERSION = 1
+# magic, format version, device count, history size in samples, sample period
+_HEADER = "<4sBBxxIq"
+# the seqlock counter, then the number of samples taken
+_COUNTERS = 24
+# reference voltage and input mode of each device
+_DEVICE = "<fBxxx"
+_DEVICES = 40
+# the readings of each device take 4 bytes, whatever its channel count
+_WIDTH = 4
+# the most bytes of incomplete commands kept for a client before it is dropped
+_MAX_PENDING = 4096
+
+
+def _layout(device_count: int, history: int) -> tuple[int, int, int, int]:
+    # offsets of the latest readings, history timestamps and history readings, and the size
+    latest = _DEVICES + struct.calcsize(_DEVICE) * device_count
+    timestamps = (latest + _WIDTH * device_count + 7) & ~7
+    readings = timestamps + 8 * history
+    return latest, timestamps, readings, readings + history * _WIDTH * device_count
+
+
+def _default_socket_path(name: str) -> str:
+    # the per-user runtime directory, which only its owner can use, or /run for services
+    return os.path.join(os.environ.get("XDG_RUNTIME_DIR", "/run"), f"{name}.sock")
+
+
+# stands in for resource_tracker.register while a client attaches to a segment
+def _skip_register(name: str, rtype: str) -> None:
+    pass
+
+
+class AcquisitionDaemon:
+    """Samples every channel of one or more `PCF8591` devices at a fixed rate and publishes
+    the readings to shared memory for `DaemonClient` to read.
+
+    Control commands from clients, such as DAC writes, are taken from a Unix socket and run
+    between samples, so only this process uses the bus.
+
+    .. code-block:: python
+
+        with AcquisitionDaemon([pcf], rate=500, name="pcf8591") as daemon:
+            daemon.run()
+
+    :param devices: The PCF8591s to sample, in the order clients refer to them
+    :param float rate: The number of samples to take per second. Default is 100
+    :param int history: The number of samples kept in the ring buffer. Default is 1024
+    :param str name: The name of the shared memory segment. Default is ``pcf8591``
+    :param str socket_path: The path of the control socket, which is made accessible to the
+        daemon's user only. Default is ``<name>.sock`` in ``$XDG_RUNTIME_DIR``, or in
+        ``/run`` when that isn't set
+    """
+
+    def __init__(
+        self,
+        devices: typing.Sequence[PCF8591],
+        rate: float = 100,
+        history: int = 1024,
+        name: str = "pcf8591",
+        socket_path: str | None = None,
+    ) -> None:
+        if not devices or len(devices) > 255:
+            raise ValueError("devices must have 1-255 devices")
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if history < 1:
+            raise ValueError("history must be at least 1")
+        self._devices = tuple(devices)
+        self._period = int(1_000_000_000 / rate)
+        self._history = history
+        count = len(self._devices)
+        self._latest, self._timestamps_offset, self._readings_offset, size = _layout(count, history)
+        self._memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        buf = self._memory.buf
+        struct.pack_into(_HEADER, buf, 0, _MAGIC, _FORMAT_VERSION, count, history, self._period)
+        for index, pcf in enumerate(self._devices):
+            struct.pack_into(
+                _DEVICE,
+                buf,
+                _DEVICES + struct.calcsize(_DEVICE) * index,
+                pcf.reference_voltage,
+                pcf.input_mode,
+            )
+        self._counters = buf[_COUNTERS : _COUNTERS + 16].cast("Q")
+        self._timestamps = buf[
+            self._timestamps_offset : self._timestamps_offset + 8 * history
+        ].cast("q")
+        self._scan = bytearray(_WIDTH * count)
+        self._slices = [
+            memoryview(self._scan)[index * _WIDTH : (index + 1) * _WIDTH] for index in range(count)
+        ]
+
+        self.socket_path = socket_path or _default_socket_path(name)
+        """The path of the control socket"""
+        try:
+            self._server = self._listen()
+        except OSError:
+            self._release_memory()
+            raise
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._server, selectors.EVENT_READ)
+
+        self.lock = threading.Lock()
+        """Lock held around every access the daemon makes to the devices"""
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.overruns = 0
+        """The number of sample periods missed because sampling fell behind"""
+        self.errors = 0
+        """The number of samples that failed with a bus error and were skipped"""
+
+    def _listen(self) -> socket.socket:
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.socket_path)
+            # only the daemon's user may drive the DAC
+            os.chmod(self.socket_path, 0o600)
+            server.listen()
+        except OSError:
+            server.close()
+            raise
+        server.setblocking(False)
+        return server
+
+    def _release_memory(self) -> None:
+        self._counters.release()
+        self._timestamps.release()
+        self._memory.close()
+        self._memory.unlink()
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory segment"""
+        return self._memory.name
+
+    @property
+    def sample_count(self) -> int:
+        """The number of samples taken"""
+        return self._counters[1]
+
+    def sample(self) -> None:
+        """Take one sample of every device and publish it"""
+        scan = self._scan
+        now = time.monotonic_ns()
+        with self.lock:
+            for pcf, readings in zip(self._devices, self._slices):
+                pcf.read_all(readings)
+
+        # publish the sample, with the sequence odd while the segment is inconsistent
+        buf = self._memory.buf
+        counters = self._counters
+        count = counters[1]
+        slot = count % self._history
+        width = len(scan)
+        history = self._readings_offset + slot * width
+        counters[0] += 1
+        buf[self._latest : self._latest + width] = scan
+        buf[history : history + width] = scan
+        self._timestamps[slot] = now
+        counters[1] = count + 1
+        counters[0] += 1
+
+    def serve(self, timeout: float = 0) -> None:
+        """Handle any pending control commands
+
+        :param float timeout: How long to wait for a command in seconds
+        """
+        for key, _ in self._selector.select(timeout):
+            if key.fileobj is self._server:
+                try:
+                    connection, _ = self._server.accept()
+                except BlockingIOError:
+                    continue
+                connection.setblocking(False)
+                self._selector.register(connection, selectors.EVENT_READ, bytearray())
+                continue
+            connection = key.fileobj
+            try:
+                data = connection.recv(4096)
+            except BlockingIOError:
+                continue
+            except ConnectionError:
+                data = b""
+            if not data:
+                self._selector.unregister(connection)
+                connection.close()
+                continue
+            key.data.extend(data)
+            # drop clients that stop replying or send a command longer than the limit
+            if not self._reply(connection, key.data) or len(key.data) > _MAX_PENDING:
+                self._selector.unregister(connection)
+                connection.close()
+
+    def _reply(self, connection: socket.socket, pending: bytearray) -> bool:
+        # run each complete command and send its reply, or return False if the client is gone
+        while b"\n" in pending:
+            end = pending.index(b"\n")
+            line = bytes(pending[:end])
+            del pending[: end + 1]
+            try:
+                connection.sendall(json.dumps(self._command(line)).encode() + b"\n")
+            except OSError:
+                return False
+        return True
+
+    def _command(self, line: bytes) -> dict:
+        try:
+            return self._handle(json.loads(line))
+        except (KeyError, TypeError, ValueError, RuntimeError, OSError) as error:
+            return {"ok": False, "error": str(error)}
+
+    def _handle(self, request: dict) -> dict:
+        command = request["command"]
+        if command == "status":
+            return {
+                "ok": True,
+                "devices": len(self._devices),
+                "samples": self.sample_count,
+                "overruns": self.overruns,
+                "errors": self.errors,
+                "period_ns": self._period,
+            }
+        device = request["device"]
+        if not isinstance(device, int) or device < 0 or device >= len(self._devices):
+            raise ValueError(f"device must be from 0-{len(self._devices) - 1}")
+        pcf = self._devices[device]
+        if command == "write":
+            value = request["value"]
+            if not isinstance(value, int) or value < 0 or value > 255:
+                raise ValueError("value must be from 0-255")
+            with self.lock:
+                pcf.write(value)
+        elif command == "dac_enabled":
+            with self.lock:
+                pcf.dac_enabled = bool(request["enabled"])
+        else:
+            raise ValueError(f"unknown command {command!r}")
+        return {"ok": True}
+
+    def run(self) -> None:
+        """Sample at the set rate and handle control commands between samples until `stop`
+        is called. A sample that fails with a bus error is counted in `errors` and skipped"""
+        period = self._period
+        deadline = time.monotonic_ns()
+        while not self._stop_event.is_set():
+            try:
+                self.sample()
+            except OSError:
+                self.errors += 1
+            now = time.monotonic_ns()
+            next_deadline = _next_deadline(deadline, now, period)
+            self.overruns += (next_deadline - deadline) // period - 1
+            deadline = next_deadline
+            if now >= deadline:
+                self.serve()
+            else:
+                self.serve((deadline - now) / 1_000_000_000)
+                # wait out the rest of the period if a command woke us early
+                now = time.monotonic_ns()
+                if now < deadline:
+                    self._stop_event.wait((deadline - now) / 1_000_000_000)
+
+    def start(self) -> None:
+        """Run the daemon in a background thread"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop `run`, and wait for the background thread if `start` was used"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop the daemon, remove the control socket and the shared memory segment"""
+        self.stop()
+        for key in list(self._selector.get_map().values()):
+            key.fileobj.close()
+        self._selector.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._release_memory()
+
+    def __enter__(self) -> AcquisitionDaemon:
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
+
+
+class DaemonClient:
+    """Reads the readings published by an `AcquisitionDaemon` and sends it control commands.
+
+    .. code-block:: python
+
+        client = DaemonClient("pcf8591")
+        light = AnalogIn(client.device(0), A0)
+        dac = AnalogOut(client.device(0), OUT)
+        print(light.voltage)
+        dac.value = 32768
+
+    :param str name: The name of the daemon's shared memory segment. Default is ``pcf8591``
+    :param str socket_path: The path of the daemon's control socket. Default is
+        ``<name>.sock`` in ``$XDG_RUNTIME_DIR``, or in ``/run`` when that isn't set
+    """
+
+    def __init__(self, name: str = "pcf8591", socket_path: str | None = None) -> None:
+        try:
+            self._memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # before Python 3.13 attaching registers the segment to be removed when this
+            # process exits, which is the job of the daemon that created it. Unregistering
+            # afterwards would also drop the daemon's registration when both share a resource
+            # tracker, as processes it starts do, so the segment isn't registered at all
+            from multiprocessing import resource_tracker  # noqa: PLC0415
+
+            register = resource_tracker.register
+            resource_tracker.register = _skip_register
+            try:
+                self._memory = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+        buf = self._memory.buf
+        magic, version, count, history, self._period = struct.unpack_from(_HEADER, buf)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            self._memory.close()
+            raise ValueError("shared memory is not a PCF8591 daemon segment")
+        self._device_count = count
+        self._history = history
+        latest, timestamps, readings, _ = _layout(count, history)
+        self._counters = buf[_COUNTERS : _COUNTERS + 16].cast("Q")
+        self._latest = buf[latest : latest + _WIDTH * count]
+        self._timestamps = buf[timestamps : timestamps + 8 * history].cast("q")
+        self._readings = buf[readings : readings + history * _WIDTH * count]
+        self._socket_path = socket_path or _default_socket_path(name)
+        self._socket = None
+        self._reader = None
+
+    @property
+    def device_count(self) -> int:
+        """The number of devices the daemon samples"""
+        return self._device_count
+
+    @property
+    def sample_count(self) -> int:
+        """The number of samples the daemon has taken"""
+        return self._counters[1]
+
+    def device(self, index: int) -> SharedPCF8591:
+        """A stand-in for one of the daemon's devices, to pass to `AnalogIn`, `AnalogOut`
+        and the other users of a `PCF8591`
+
+        :param int index: The index of the device in the daemon's device list
+        """
+        if index < 0 or index >= self._device_count:
+            raise ValueError(f"index must be from 0-{self._device_count - 1}")
+        return SharedPCF8591(self, index)
+
+    def read(self, device: int, channel: int) -> int:
+        """The latest reading of a channel
+
+        :param int device: The index of the device
+        :param int channel: The ADC channel
+        """
+        counters = self._counters
+        index = device * _WIDTH + channel
+        while True:
+            sequence = counters[0]
+            if sequence & 1:
+                continue
+            reading = self._latest[index]
+            if counters[0] == sequence:
+                return reading
+
+    def read_all(self, device: int, buffer: WriteableBuffer) -> WriteableBuffer:
+        """Copy the latest readings of every channel of a device, all from the same sample
+
+        :param int device: The index of the device
+        :param buffer: A buffer of at least 4 bytes to fill, or as many as the device has
+            channels
+        :return: The buffer holding the readings
+        """
+        counters = self._counters
+        start = device * _WIDTH
+        count = min(len(buffer), _WIDTH)
+        while True:
+            sequence = counters[0]
+            if sequence & 1:
+                continue
+            buffer[:count] = self._latest[start : start + count]
+            if counters[0] == sequence:
+                return buffer
+
+    def history(
+        self,
+        device: int,
+        channel: int,
+        out: WriteableBuffer | None = None,
+        timestamps: array | None = None,
+    ) -> WriteableBuffer:
+        """Copy the readings of a channel held in the ring buffer, oldest first
+
+        :param int device: The index of the device
+        :param int channel: The ADC channel
+        :param out: Optional buffer to fill. If not given, a new ``bytearray`` the size of the
+            history is created
+        :param timestamps: Optional ``array("q")`` to fill with the ``time.monotonic_ns()``
+            time of each reading, as the daemon's clock
+        :return: ``out`` sliced to the readings copied
+        """
+        if out is None:
+            out = bytearray(self._history)
+        target = memoryview(out)
+        stride = _WIDTH * self._device_count
+        offset = device * _WIDTH + channel
+        counters = self._counters
+        while True:
+            sequence = counters[0]
+            if sequence & 1:
+                continue
+            total = counters[1]
+            length = min(total, self._history, len(out))
+            if timestamps is not None:
+                length = min(length, len(timestamps))
+            first = (total - length) % self._history
+            # the oldest readings run to the end of the ring, the rest wrap to the start
+            head = min(length, self._history - first)
+            target[:head] = self._readings[offset + first * stride :: stride][:head]
+            target[head:length] = self._readings[offset::stride][: length - head]
+            if timestamps is not None:
+                for index in range(length):
+                    timestamps[index] = self._timestamps[(first + index) % self._history]
+            if counters[0] == sequence:
+                return target[:length]
+
+    def reference_voltage(self, device: int) -> float:
+        """The reference voltage of a device
+
+        :param int device: The index of the device
+        """
+        return struct.unpack_from(
+            _DEVICE, self._memory.buf, _DEVICES + struct.calcsize(_DEVICE) * device
+        )[0]
+
+    def input_mode(self, device: int) -> int:
+        """The input mode a device is sampled in
+
+        :param int device: The index of the device
+        """
+        return struct.unpack_from(
+            _DEVICE, self._memory.buf, _DEVICES + struct.calcsize(_DEVICE) * device
+        )[1]
+
+    def command(self, command: str, **arguments: typing.Any) -> dict:
+        """Send a control command to the daemon and wait for its reply
+
+        :param str command: ``write``, ``dac_enabled`` or ``status``
+        :return: The reply
+        """
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.connect(self._socket_path)
+            self._reader = self._socket.makefile("rb")
+        arguments["command"] = command
+        self._socket.sendall(json.dumps(arguments).encode() + b"\n")
+        reply = json.loads(self._reader.readline())
+        if not reply.pop("ok"):
+            raise RuntimeError(reply["error"])
+        return reply
+
+    def status(self) -> dict:
+        """The daemon's device count, sample count, overruns and sample period"""
+        return self.command("status")
+
+    def close(self) -> None:
+        """Close the control socket and release the shared memory"""
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+            self._socket = None
+        for view in (self._counters, self._latest, self._timestamps, self._readings):
+            view.release()
+        self._memory.close()
+
+    def __enter__(self) -> DaemonClient:
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
+
+
+class SharedPCF8591:
+    """One device of an `AcquisitionDaemon`, as seen by a `DaemonClient`. Readings come from
+    shared memory and DAC writes are sent to the daemon, so it can be passed to `AnalogIn`,
+    `DifferentialAnalogIn`, `AnalogInGroup` and `AnalogOut` in place of a `PCF8591`.
+
+    :param DaemonClient client: The client of the daemon
+    :param int index: The index of the device in the daemon's device list
+    """
+
+    def __init__(self, client: DaemonClient, index: int) -> None:
+        self._client = client
+        self._index = index
+        self._input_mode = client.input_mode(index)
+        self._reference_voltage = client.reference_voltage(index)
+        self._dac_enabled = False
+        self._scan = bytearray(_WIDTH)
+        self.calibration = None
+        """Calibration isn't shared by the daemon; set one here to apply it in this process"""
+
+    @property
+    def reference_voltage(self) -> float:
+        """The reference voltage of the device"""
+        return self._reference_voltage
+
+    @property
+    def input_mode(self) -> int:
+        """The input mode the daemon samples the device in"""
+        return self._input_mode
+
+    @property
+    def channel_count(self) -> int:
+        """The number of ADC channels in the input mode"""
+        return _CHANNEL_COUNTS[self._input_mode]
+
+    def is_differential(self, channel: int) -> bool:
+        """True if the channel reads a differential input in the input mode
+
+        :param int channel: The ADC channel
+        """
+        return bool(_DIFFERENTIAL_CHANNELS[self._input_mode] & (1 << channel))
+
+    def _check_channel(self, channel: int) -> None:
+        if channel < 0 or channel >= self.channel_count:
+            raise ValueError(f"channel must be from 0-{self.channel_count - 1}")
+
+    def read(self, channel: int) -> int:
+        """The latest reading of a channel from shared memory
+
+        :param int channel: The ADC channel, 0 thru `channel_count` - 1
+        """
+        self._check_channel(channel)
+        return self._client.read(self._index, channel)
+
+    def read_all(self, buffer: WriteableBuffer | None = None) -> WriteableBuffer:
+        """The latest readings of every channel from shared memory, all from one sample
+
+        :param buffer: Optional buffer of at least `channel_count` bytes to fill. If not
+            given, a new ``bytearray`` is created
+        :return: The buffer holding the readings
+        """
+        count = self.channel_count
+        if buffer is None:
+            buffer = bytearray(count)
+        elif len(buffer) < count:
+            raise ValueError(f"buffer must hold at least {count} bytes")
+        scan = self._client.read_all(self._index, self._scan)
+        for channel in range(count):
+            buffer[channel] = scan[channel]
+        return buffer
+
+    @property
+    def dac_enabled(self) -> bool:
+        """Enables the DAC of the device through the daemon"""
+        return self._dac_enabled
+
+    @dac_enabled.setter
+    def dac_enabled(self, enable_dac: bool) -> None:
+        self._client.command("dac_enabled", device=self._index, enabled=bool(enable_dac))
+        self._dac_enabled = enable_dac
+
+    def write(self, value: int) -> None:
+        """Write a uint8_t value to the DAC of the device through the daemon
+
+        :param int value: The value to write
+        """
+        self._client.command("write", device=self._index, value=value)
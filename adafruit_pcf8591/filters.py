@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`filters`
+================================================================================
+
+Filters for smoothing PCF8591 ADC readings. They use integer math and fixed-size state
+allocated up front, so updating them doesn't allocate.
+
+Filters can be set on an `AnalogIn` with `AnalogIn.filter`, which then reads a burst of
+`Filter.samples` readings for each ``value``, or fed directly with `Filter.update` and
+`Filter.extend`, for example from `PCF8591.read_all` readings.
+
+* Author(s): Adafruit Industries
+"""
+
+from __future__ import annotations
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from circuitpython_typing import ReadableBuffer
+
+
+class Filter:
+    """Base class of the filters. Filters take raw 8-bit readings and return a 16-bit value
+
+    :param int samples: The number of readings `AnalogIn` takes for each ``value``
+    """
+
+    def __init__(self, samples: int = 1) -> None:
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+        self._samples = samples
+        self._value = 0
+
+    @property
+    def samples(self) -> int:
+        """The number of readings `AnalogIn` takes for each ``value``"""
+        return self._samples
+
+    @property
+    def bits(self) -> int:
+        """The effective resolution of `Filter.value` in bits"""
+        return 8
+
+    @property
+    def value(self) -> int:
+        """The filtered value, scaled to a 16-bit integer like `AnalogIn.value`. Reading it
+        doesn't access the bus"""
+        return self._value
+
+    def update(self, raw: int) -> None:
+        """Add a raw 8-bit reading to the filter
+
+        :param int raw: The reading
+        """
+        raise NotImplementedError
+
+    def extend(self, readings: ReadableBuffer) -> None:
+        """Add a buffer of raw 8-bit readings to the filter, oldest first
+
+        :param readings: The readings
+        """
+        for raw in readings:
+            self.update(raw)
+
+    def reset(self) -> None:
+        """Clear the filter's state"""
+        self._value = 0
+
+
+class Oversample(Filter):
+    """Oversample and decimate: sums 4 ** ``extra_bits`` readings for each output, giving
+    ``extra_bits`` of additional resolution when the input has at least 1 LSB of noise.
+
+    `Filter.value` only changes once every `Filter.samples` readings.
+
+    :param int extra_bits: The number of bits of resolution to add, 1-4. Default is 2
+    """
+
+    def __init__(self, extra_bits: int = 2) -> None:
+        if extra_bits < 1 or extra_bits > 4:
+            raise ValueError("extra_bits must be from 1-4")
+        super().__init__(4**extra_bits)
+        self._extra_bits = extra_bits
+        self._sum = 0
+        self._count = 0
+
+    @property
+    def bits(self) -> int:
+        return 8 + self._extra_bits
+
+    def update(self, raw: int) -> None:
+        self._sum += raw
+        self._count += 1
+        if self._count == self._samples:
+            # the sum has 8 + 2 * extra_bits bits; keep 8 + extra_bits and scale to 16
+            self._value = (self._sum >> self._extra_bits) << (8 - self._extra_bits)
+            self._sum = 0
+            self._count = 0
+
+    def reset(self) -> None:
+        super().reset()
+        self._sum = 0
+        self._count = 0
+
+
+class MovingAverage(Filter):
+    """The average of the most recent ``size`` readings
+
+    :param int size: The number of readings averaged, 1-256
+    :param int samples: The number of readings `AnalogIn` takes for each ``value``. Default is 1
+    """
+
+    def __init__(self, size: int, samples: int = 1) -> None:
+        if size < 1 or size > 256:
+            raise ValueError("size must be from 1-256")
+        super().__init__(samples)
+        self._window = bytearray(size)
+        self._index = 0
+        self._count = 0
+        self._sum = 0
+
+    def update(self, raw: int) -> None:
+        window = self._window
+        if self._count < len(window):
+            self._count += 1
+        else:
+            self._sum -= window[self._index]
+        window[self._index] = raw
+        self._sum += raw
+        self._index = (self._index + 1) % len(window)
+        self._value = (self._sum << 8) // self._count
+
+    def reset(self) -> None:
+        super().reset()
+        self._index = 0
+        self._count = 0
+        self._sum = 0
+
+
+class Median(Filter):
+    """The median of the most recent ``size`` readings, which rejects short spikes
+
+    :param int size: The number of readings, an odd number from 3-31
+    :param int samples: The number of readings `AnalogIn` takes for each ``value``. Default is 1
+    """
+
+    def __init__(self, size: int = 5, samples: int = 1) -> None:
+        if size < 3 or size > 31 or not size % 2:
+            raise ValueError("size must be an odd number from 3-31")
+        super().__init__(samples)
+        self._window = bytearray(size)
+        self._sorted = bytearray(size)
+        self._index = 0
+        self._count = 0
+
+    def update(self, raw: int) -> None:
+        window = self._window
+        ordered = self._sorted
+        count = self._count
+        if count < len(window):
+            count += 1
+            self._count = count
+        else:
+            # remove the reading being replaced from the sorted copy
+            old = window[self._index]
+            position = 0
+            while ordered[position] != old:
+                position += 1
+            while position < count - 1:
+                ordered[position] = ordered[position + 1]
+                position += 1
+        window[self._index] = raw
+        self._index = (self._index + 1) % len(window)
+        # insertion sort the new reading into place
+        position = count - 1
+        while position > 0 and ordered[position - 1] > raw:
+            ordered[position] = ordered[position - 1]
+            position -= 1
+        ordered[position] = raw
+        self._value = ordered[count // 2] << 8
+
+    def reset(self) -> None:
+        super().reset()
+        self._index = 0
+        self._count = 0
+
+
+class LowPass(Filter):
+    """A single-pole IIR low pass filter: each reading moves the output 1 / 2 ** ``shift`` of
+    the way towards it
+
+    :param int shift: Sets the smoothing; larger is smoother and slower, 1-8. Default is 3
+    :param int samples: The number of readings `AnalogIn` takes for each ``value``. Default is 1
+    """
+
+    def __init__(self, shift: int = 3, samples: int = 1) -> None:
+        if shift < 1 or shift > 8:
+            raise ValueError("shift must be from 1-8")
+        super().__init__(samples)
+        self._shift = shift
+        # the output with 8 extra fractional bits, or -1 before the first reading
+        self._state = -1
+
+    def update(self, raw: int) -> None:
+        if self._state < 0:
+            self._state = raw << 16
+        else:
+            self._state += ((raw << 16) - self._state) >> self._shift
+        self._value = self._state >> 8
+
+    def reset(self) -> None:
+        super().reset()
+        self._state = -1
@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`instrumentation`
+================================================================================
+
+Opt-in bus instrumentation for the PCF8591 driver.
+
+* Author(s): Adafruit Industries
+"""
+
+from __future__ import annotations
+
+import time
+
+from adafruit_pcf8591.pcf8591 import _CHANNEL_COUNTS
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from adafruit_bus_device.i2c_device import I2CDevice
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+# upper bounds of the transaction latency histogram buckets, in microseconds. The last bucket
+# counts everything slower
+LATENCY_BUCKETS_US = (32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+
+class Instrumentation:
+    """Records statistics of every I2C transaction a `PCF8591` makes.
+
+    Instrumentation works by swapping the ``i2c_device`` of the `PCF8591` for a wrapper that
+    records each transaction, so an uninstrumented `PCF8591` runs exactly the same code as
+    before. Call `remove` (or use it as a context manager) to put the original device back.
+
+    .. code-block:: python
+
+        with Instrumentation(pcf) as instrumentation:
+            for _ in range(100):
+                pcf.read(0)
+            print(instrumentation.stats())
+
+    :param ~adafruit_pcf8591.pcf8591.PCF8591 pcf: The PCF8591 to instrument.
+    :param callback: Optional function called after every transaction with the number of
+        bytes written, the number of bytes read, and the transaction time in nanoseconds
+    """
+
+    def __init__(
+        self,
+        pcf: PCF8591,
+        callback: typing.Callable[[int, int, int], None] | None = None,
+    ) -> None:
+        if isinstance(pcf.i2c_device, _InstrumentedI2CDevice):
+            raise RuntimeError("PCF8591 is already instrumented")
+        self._pcf = pcf
+        self.callback = callback
+        """Function called after every transaction, or None"""
+        self._device = _InstrumentedI2CDevice(pcf.i2c_device, self)
+        self.reset()
+        pcf.i2c_device = self._device
+
+    def reset(self) -> None:
+        """Set all statistics back to zero"""
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.lock_wait_ns = 0
+        self.busy_ns = 0
+        self.latency_histogram = [0] * (len(LATENCY_BUCKETS_US) + 1)
+        self.conversions = [0] * 4
+        # the channel whose conversion the next byte read returns, and whether that byte is
+        # the leftover conversion from before the last control byte was written
+        self._channel = 0
+        self._stale = True
+        self._start = time.monotonic_ns()
+
+    def remove(self) -> None:
+        """Stop recording and restore the `PCF8591`'s original I2C device"""
+        if self._pcf.i2c_device is self._device:
+            self._pcf.i2c_device = self._device.device
+
+    def __enter__(self) -> Instrumentation:
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.remove()
+
+    def stats(self) -> dict[str, typing.Any]:
+        """A snapshot of the statistics recorded since instrumentation started or was reset
+
+        * ``elapsed_ns``: time covered by the statistics
+        * ``transactions``: number of I2C transactions
+        * ``bytes_written`` and ``bytes_read``: data bytes, not counting address bytes
+        * ``lock_wait_ns``: total time spent waiting to lock the bus
+        * ``busy_ns``: total time spent in transactions
+        * ``latency_histogram``: number of transactions in each bucket of ``LATENCY_BUCKETS_US``
+        * ``conversion_rates``: A/D conversion results read back per second for each channel.
+          The first byte read after each control byte is not counted, as it holds the
+          conversion made before the control byte was written. A `PCF8591.read` that
+          switches channels counts two, as it also drops the first reading of the new channel
+        """
+        elapsed = time.monotonic_ns() - self._start
+        seconds = elapsed / 1_000_000_000 if elapsed > 0 else 1
+        return {
+            "elapsed_ns": elapsed,
+            "transactions": self.transactions,
+            "bytes_written": self.bytes_written,
+            "bytes_read": self.bytes_read,
+            "lock_wait_ns": self.lock_wait_ns,
+            "busy_ns": self.busy_ns,
+            "latency_histogram": tuple(self.latency_histogram),
+            "conversion_rates": tuple(count / seconds for count in self.conversions),
+        }
+
+    def _record(self, control: int, written: int, read: int, latency: int) -> None:
+        self.transactions += 1
+        self.bytes_written += written
+        self.bytes_read += read
+        self.busy_ns += latency
+
+        bucket = 0
+        latency_us = latency // 1000
+        while bucket < len(LATENCY_BUCKETS_US) and latency_us >= LATENCY_BUCKETS_US[bucket]:
+            bucket += 1
+        self.latency_histogram[bucket] += 1
+
+        # writing a control byte selects a channel, but the next byte read is still the
+        # conversion started before it; each byte after that returns a conversion of the
+        # selected channel, which steps along with the auto-increment flag
+        if written:
+            self._channel = control & 0x03
+            self._stale = True
+        if read and self._stale:
+            read -= 1
+            self._stale = False
+        channel = self._channel
+        count = _CHANNEL_COUNTS[(control >> 4) & 0x03]
+        for _ in range(read):
+            self.conversions[channel] += 1
+            if control & 0x04:
+                channel = (channel + 1) % count
+        self._channel = channel
+
+        if self.callback is not None:
+            self.callback(written, read, latency)
+
+
+class _InstrumentedI2CDevice:
+    # stands in for the I2CDevice of an instrumented PCF8591, timing each call
+
+    def __init__(self, device: I2CDevice, instrumentation: Instrumentation) -> None:
+        self.device = device
+        self.i2c = device.i2c
+        self.device_address = device.device_address
+        self._instrumentation = instrumentation
+        self._control = 0
+
+    def __enter__(self) -> _InstrumentedI2CDevice:
+        start = time.monotonic_ns()
+        self.device.__enter__()
+        self._instrumentation.lock_wait_ns += time.monotonic_ns() - start
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> bool:
+        return self.device.__exit__(exception_type, exception_value, traceback)
+
+    def write(self, buf: ReadableBuffer, *, start: int = 0, end: int | None = None):
+        if end is None:
+            end = len(buf)
+        begin = time.monotonic_ns()
+        self.device.write(buf, start=start, end=end)
+        latency = time.monotonic_ns() - begin
+        if end > start:
+            self._control = buf[start]
+        self._instrumentation._record(self._control, end - start, 0, latency)
+
+    def readinto(self, buf: WriteableBuffer, *, start: int = 0, end: int | None = None):
+        if end is None:
+            end = len(buf)
+        begin = time.monotonic_ns()
+        self.device.readinto(buf, start=start, end=end)
+        latency = time.monotonic_ns() - begin
+        self._instrumentation._record(self._control, 0, end - start, latency)
+
+    def write_then_readinto(
+        self,
+        out_buffer: ReadableBuffer,
+        in_buffer: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: int | None = None,
+        in_start: int = 0,
+        in_end: int | None = None,
+    ):
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        # the buffers may be the same, so take the control byte before it's overwritten
+        if out_end > out_start:
+            self._control = out_buffer[out_start]
+        begin = time.monotonic_ns()
+        self.device.write_then_readinto(
+            out_buffer,
+            in_buffer,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        latency = time.monotonic_ns() - begin
+        self._instrumentation._record(
+            self._control, out_end - out_start, in_end - in_start, latency
+        )
@@ -23,27 +23,31 @@ Implementation Notes
   https://github.com/adafruit/circuitpython/releases
 
  * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
- * Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
 """
 
+from __future__ import annotations
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_PCF8591.git"
 # from time import sleep
-from struct import unpack_from
 
 from adafruit_bus_device import i2c_device
 from micropython import const
 
-try:
-    import typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Literal
 
     from busio import I2C
-    from typing_extensions import Literal
-except ImportError:
-    pass
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+
+    from adafruit_pcf8591.aio import AsyncSampleIterator
+    from adafruit_pcf8591.calibration import Calibration
 
 _PCF8591_DEFAULT_ADDR = const(0x48)  # PCF8591 Default Address
 _PCF8591_ENABLE_DAC = const(0x40)  # control bit for having the DAC active
+_PCF8591_AUTO_INCREMENT = const(0x04)  # control bit to step through the channels on each read
+_PCF8591_STREAM_CHUNK = const(128)  # default number of DAC samples sent per I2C write
 
 # Pin constants
 A0 = const(0)
@@ -53,12 +57,25 @@ A3 = const(3)
 
 OUT = const(0)
 
+# Analog input programs
+SINGLE_ENDED = const(0)  # four single-ended inputs
+THREE_DIFFERENTIAL = const(1)  # A0, A1 and A2 each measured against A3
+MIXED = const(2)  # A0 and A1 single-ended, A2 measured against A3
+TWO_DIFFERENTIAL = const(3)  # A0 measured against A1, A2 measured against A3
+
+# number of channels and bitmask of the differential channels for each input program
+_CHANNEL_COUNTS = (4, 3, 3, 2)
+_DIFFERENTIAL_CHANNELS = (0b0000, 0b0111, 0b0100, 0b0011)
+
 
 class PCF8591:
     """Driver for the PCF8591 DAC & ADC Combo breakout.
 
     :param ~busio.I2C i2c_bus: The I2C bus the PCF8591 is connected to.
     :param int address: The I2C device address for the sensor. Default is ``0x28``.
+    :param float reference_voltage: The voltage level that ADC signals are compared to.
+    :param int input_mode: The analog input program; one of ``SINGLE_ENDED``,
+        ``THREE_DIFFERENTIAL``, ``MIXED`` or ``TWO_DIFFERENTIAL``. Default is ``SINGLE_ENDED``
 
     """
 
@@ -67,16 +84,35 @@ class PCF8591:
         i2c_bus: I2C,
         address: int = _PCF8591_DEFAULT_ADDR,
         reference_voltage: float = 3.3,
+        input_mode: Literal[0, 1, 2, 3] = SINGLE_ENDED,
     ) -> None:
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
         self._dacval = 0
         self._dac_enabled = False
+        if input_mode < SINGLE_ENDED or input_mode > TWO_DIFFERENTIAL:
+            raise ValueError("input_mode must be from 0-3")
+        self._input_mode = input_mode
         # this is the range supported by the PCF8591
         if 2.5 <= reference_voltage <= 6.0:
             self._reference_voltage = reference_voltage
         else:
             raise ValueError("reference_voltage must be from 2.5 - 6.0")
         self._buffer = bytearray(2)
+        # control bytes for each channel and the DAC data byte sent with them, kept up to date
+        # by `_update_control` so that reads and writes only copy them into `_buffer`
+        self._control = 0
+        self._controls = bytearray(4)
+        self._dac_data = 0
+        self._update_control()
+        # the control byte of the last read, or -1 before the first, so repeated reads of the
+        # same channel can skip the extra read made after switching channels
+        self._last_control = -1
+        self._fresh_reads = False
+        # serializes the coroutines in `adafruit_pcf8591.aio`, created on first use
+        self._async_lock = None
+        self._calibration = None
+        # one leading byte for the previous conversion, then one per channel
+        self._scan_buffer = bytearray(5)
         # possibly measure each channel here to prep readings for
         # user calls to `read`
 
@@ -86,33 +122,244 @@ class PCF8591:
         An ADC value of 65535 will equal `reference_voltage`"""
         return self._reference_voltage
 
-    def _half_read(self, channel: Literal[0, 1, 2, 3]) -> None:
+    @property
+    def calibration(self) -> Calibration | None:
+        """The `Calibration` applied by `AnalogIn` and `AnalogOut` objects created afterwards,
+        or None for uncalibrated readings. Raw readings from `read` are never calibrated"""
+        return self._calibration
+
+    @calibration.setter
+    def calibration(self, calibration: Calibration | None) -> None:
+        if (
+            calibration is not None
+            and abs(calibration.reference_voltage - self._reference_voltage) > 0.001
+        ):
+            raise ValueError("calibration was made with a different reference_voltage")
+        self._calibration = calibration
+
+    @property
+    def fresh_reads(self) -> bool:
+        """When False, the default, `read` makes a single I2C transaction when the channel was
+        also the one read last, and two after switching channels, dropping the first reading
+        of the new channel. When True, every `read` makes two transactions. Either way the
+        value returned is converted during the call: the first byte of each read is the
+        previous conversion and is dropped, and the second is converted after the control
+        byte selecting the channel is written"""
+        return self._fresh_reads
+
+    @fresh_reads.setter
+    def fresh_reads(self, fresh_reads: bool) -> None:
+        self._fresh_reads = fresh_reads
+
+    @property
+    def input_mode(self) -> int:
+        """The analog input program, which sets how the four inputs are combined into channels.
+        One of ``SINGLE_ENDED``, ``THREE_DIFFERENTIAL``, ``MIXED`` or ``TWO_DIFFERENTIAL``.
+        Differential channels read as signed, two's complement values"""
+        return self._input_mode
+
+    @input_mode.setter
+    def input_mode(self, input_mode: Literal[0, 1, 2, 3]) -> None:
+        if input_mode < SINGLE_ENDED or input_mode > TWO_DIFFERENTIAL:
+            raise ValueError("input_mode must be from 0-3")
+        self._input_mode = input_mode
+        self._update_control()
+
+    @property
+    def channel_count(self) -> int:
+        """The number of ADC channels provided by the current `input_mode`"""
+        return _CHANNEL_COUNTS[self._input_mode]
+
+    def is_differential(self, channel: Literal[0, 1, 2, 3]) -> bool:
+        """Whether an ADC channel is a differential input in the current `input_mode`
+
+        :param int channel: The ADC channel to check
+        """
+        return bool(_DIFFERENTIAL_CHANNELS[self._input_mode] & (1 << channel))
+
+    def _check_channel(self, channel: int) -> None:
+        if channel < 0 or channel >= _CHANNEL_COUNTS[self._input_mode]:
+            raise ValueError(f"channel must be from 0-{_CHANNEL_COUNTS[self._input_mode] - 1}")
+
+    def _update_control(self) -> None:
+        # the second byte is written to the DAC, so keep it at the current DAC value
         if self._dac_enabled:
-            self._buffer[0] = _PCF8591_ENABLE_DAC
-            self._buffer[1] = self._dacval
+            self._control = _PCF8591_ENABLE_DAC
+            self._dac_data = self._dacval
         else:
-            self._buffer[0] = 0
-            self._buffer[1] = 0
+            self._control = 0
+            self._dac_data = 0
+        self._control |= self._input_mode << 4
+        for channel in range(4):
+            self._controls[channel] = self._control | channel
 
-        self._buffer[0] |= channel & 0x3
+    def _set_control(self, control: int) -> None:
+        self._buffer[0] = self._control | control
+        self._buffer[1] = self._dac_data
+
+    def _half_read(self, channel: Literal[0, 1, 2, 3]) -> None:
+        control = self._controls[channel]
+        buffer = self._buffer
+        buffer[0] = control
+        buffer[1] = self._dac_data
 
         with self.i2c_device as i2c:
-            i2c.write_then_readinto(self._buffer, self._buffer)
+            i2c.write_then_readinto(buffer, buffer)
+        self._last_control = control
 
     def read(self, channel: Literal[0, 1, 2, 3]) -> int:
-        """Read an analog value from one of the four ADC inputs
+        """Read an analog value from one of the ADC channels
 
-        :param int channel: The single-ended ADC channel to read from, 0 thru 3
+        Single-ended channels read from 0 to 255. Differential channels return the same raw
+        byte, which holds a two's complement value from -128 to 127
+
+        :param int channel: The ADC channel to read from, 0 thru `channel_count` - 1
         """
-        if channel < 0 or channel > 3:
-            raise ValueError("channel must be from 0-3")
-        # reads are started on the ACK of the WRITE to the 'register' and
-        # not returned until the read after the _next_ WRITE so we have to
-        # do it twice to get the actual value
-        self._half_read(channel)
+        self._check_channel(channel)
+        # the first byte of each read is the previous conversion, so the value is the second;
+        # after switching channels the first reading of the new channel is also dropped
+        if self._fresh_reads or self._controls[channel] != self._last_control:
+            self._half_read(channel)
         self._half_read(channel)
 
-        return unpack_from(">B", self._buffer[1:])[0]
+        return self._buffer[1]
+
+    def _scan(self, i2c: i2c_device.I2CDevice, count: int) -> None:
+        # reads channels 0 thru count - 1 into `_scan_buffer[1:]` with the device already locked
+        self._set_control(_PCF8591_AUTO_INCREMENT)
+        # the first byte read is the result of the conversion started by the previous read,
+        # so read one extra byte and drop it; the rest are the channels in order
+        i2c.write_then_readinto(self._buffer, self._scan_buffer, in_end=count + 1)
+        self._last_control = self._buffer[0]
+
+    def read_all(self, buffer: WriteableBuffer | None = None) -> WriteableBuffer:
+        """Read every ADC channel in a single I2C transaction using the auto-increment flag
+
+        :param buffer: Optional buffer of at least `channel_count` bytes to fill with the
+            readings of each channel, in order. If not given, a new ``bytearray`` is created
+        :return: The buffer holding the readings
+        """
+        count = _CHANNEL_COUNTS[self._input_mode]
+        if buffer is None:
+            buffer = bytearray(count)
+        elif len(buffer) < count:
+            raise ValueError(f"buffer must hold at least {count} bytes")
+
+        with self.i2c_device as i2c:
+            self._scan(i2c, count)
+
+        scan_buffer = self._scan_buffer
+        for i in range(count):
+            buffer[i] = scan_buffer[i + 1]
+        return buffer
+
+    def read_burst(self, channel: Literal[0, 1, 2, 3], buffer: WriteableBuffer) -> WriteableBuffer:
+        """Fill a buffer with consecutive readings of one ADC input
+
+        The control byte is only sent once at the start of the burst, after which every byte
+        of ``buffer`` is filled from a single read, one conversion per byte.
+
+        :param int channel: The ADC channel to read from, 0 thru `channel_count` - 1
+        :param buffer: A ``bytearray`` or ``memoryview`` to fill with readings
+        :return: The buffer holding the readings
+        """
+        self._check_channel(channel)
+
+        self._set_control(channel)
+        with self.i2c_device as i2c:
+            # the first byte read after selecting the channel is the previous conversion,
+            # so read it on its own and drop it before reading the burst
+            i2c.write_then_readinto(self._buffer, self._buffer, in_end=1)
+            i2c.readinto(buffer)
+        self._last_control = self._controls[channel]
+        return buffer
+
+    def transceive(
+        self,
+        out_buf: ReadableBuffer,
+        channel: Literal[0, 1, 2, 3],
+        in_buf: WriteableBuffer | None = None,
+    ) -> WriteableBuffer:
+        """Step the DAC through a buffer of samples, reading an ADC channel after each step
+
+        Each step is a single I2C transaction that writes the DAC sample and then reads the
+        channel. The conversion returned is started after the DAC sample is written, so
+        ``in_buf[i]`` is always the response to ``out_buf[i]``. The bus stays locked for the
+        whole buffer so nothing else can come between the steps.
+
+        :param out_buf: The DAC samples, one byte each, 0-255
+        :param int channel: The ADC channel to read from, 0 thru `channel_count` - 1
+        :param in_buf: Optional buffer at least as long as ``out_buf`` to fill with the
+            readings. If not given, a new ``bytearray`` is created
+        :return: The buffer holding the readings
+        """
+        self._check_channel(channel)
+        if not self._dac_enabled:
+            raise RuntimeError("DAC must be enabled to transceive")
+        length = len(out_buf)
+        if in_buf is None:
+            in_buf = bytearray(length)
+        elif len(in_buf) < length:
+            raise ValueError("in_buf must be at least as long as out_buf")
+        if not length:
+            return in_buf
+        # check every sample before sending any, so a bad one can't leave the DAC part way
+        if min(out_buf) < 0 or max(out_buf) > 255:
+            raise ValueError("out_buf samples must be from 0-255")
+
+        control = self._controls[channel]
+        buffer = self._buffer
+        buffer[0] = control
+        result = self._scan_buffer
+        with self.i2c_device as i2c:
+            for index in range(length):
+                buffer[1] = out_buf[index]
+                # the first byte read is the conversion started before the DAC changed;
+                # the second is converted after it
+                i2c.write_then_readinto(buffer, result, in_end=2)
+                in_buf[index] = result[1]
+        self._dacval = self._dac_data = out_buf[-1]
+        self._last_control = control
+        return in_buf
+
+    async def aread(self, channel: Literal[0, 1, 2, 3]) -> int:
+        """Coroutine version of `read` that doesn't block the event loop while on the bus
+
+        :param int channel: The ADC channel to read from, 0 thru `channel_count` - 1
+        """
+        from adafruit_pcf8591.aio import run_serialized  # noqa: PLC0415
+
+        self._check_channel(channel)
+        return await run_serialized(self, self.read, channel)
+
+    async def aread_all(self, buffer: WriteableBuffer | None = None) -> WriteableBuffer:
+        """Coroutine version of `read_all` that doesn't block the event loop while on the bus
+
+        :param buffer: Optional buffer of at least `channel_count` bytes to fill with the
+            readings of each channel, in order. If not given, a new ``bytearray`` is created
+        """
+        from adafruit_pcf8591.aio import run_serialized  # noqa: PLC0415
+
+        return await run_serialized(self, self.read_all, buffer)
+
+    def asamples(
+        self,
+        rate: float,
+        buffer: WriteableBuffer | None = None,
+        count: int | None = None,
+    ) -> AsyncSampleIterator:
+        """Asynchronous iterator returning readings of every ADC channel at a target rate::
+
+            async for sample in pcf.asamples(100):
+                print(sample[0])
+
+        :param float rate: The number of samples to take per second
+        :param buffer: Optional buffer to fill with each sample, as with `read_all`
+        :param int count: The number of samples to take before stopping, or None to never stop
+        """
+        from adafruit_pcf8591.aio import AsyncSampleIterator  # noqa: PLC0415
+
+        return AsyncSampleIterator(self, rate, buffer, count)
 
     @property
     def dac_enabled(self) -> bool:
@@ -122,6 +369,7 @@ class PCF8591:
     @dac_enabled.setter
     def dac_enabled(self, enable_dac: bool) -> None:
         self._dac_enabled = enable_dac
+        self._update_control()
         self.write(self._dacval)
 
     def write(self, value: int) -> None:
@@ -130,11 +378,50 @@ class PCF8591:
         :param int value: The value to write: 0 is GND and 65535 is VCC
 
         """
-
-        self._buffer = bytearray(2)
-        if self._dac_enabled:
-            self._buffer[0] = _PCF8591_ENABLE_DAC
-            self._buffer[1] = value
+        if value < 0 or value > 255:
+            raise ValueError("value must be from 0-255")
         self._dacval = value
+        if self._dac_enabled:
+            self._dac_data = value
+        buffer = self._buffer
+        buffer[0] = self._control
+        buffer[1] = self._dac_data
+        with self.i2c_device as i2c:
+            i2c.write(buffer)
+
+    def write_stream(
+        self,
+        buffer: ReadableBuffer,
+        loops: int = 1,
+        chunk_size: int = _PCF8591_STREAM_CHUNK,
+    ) -> None:
+        """Write a sequence of uint8_t values to the DAC output
+
+        Every data byte following a control byte is a new DAC value, so the samples are sent
+        in I2C writes of up to ``chunk_size`` samples, each prefixed with a single control byte.
+
+        :param buffer: The samples to write, one byte per sample
+        :param int loops: The number of times to play the whole buffer
+        :param int chunk_size: The maximum number of samples sent per I2C write
+        """
+        if not self._dac_enabled:
+            raise RuntimeError("DAC must be enabled to stream samples")
+        if loops < 1:
+            raise ValueError("loops must be at least 1")
+        length = len(buffer)
+        if not length:
+            return
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        chunk_size = min(chunk_size, length)
+        stream_buffer = bytearray(chunk_size + 1)
+        stream_buffer[0] = self._control
+        samples = memoryview(buffer)
         with self.i2c_device as i2c:
-            i2c.write_then_readinto(self._buffer, self._buffer)
+            for _ in range(loops):
+                for start in range(0, length, chunk_size):
+                    end = min(start + chunk_size, length)
+                    stream_buffer[1 : end - start + 1] = samples[start:end]
+                    i2c.write(stream_buffer, end=end - start + 1)
+        self._dacval = self._dac_data = buffer[-1]
@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`pcf8591_array`
+================================================================================
+
+Polling of ADC channels across several PCF8591s sharing one I2C bus.
+
+* Author(s): Adafruit Industries
+"""
+
+from __future__ import annotations
+
+import time
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+
+class PCF8591Array:
+    """Polls ADC channels of several `PCF8591` devices that share one I2C bus.
+
+    Channels are added to a polling plan with `add_channel`, each with its own rate. Every
+    call to `poll` makes one sweep of the bus: the bus is locked once, and each device with a
+    channel due is read with a single auto-increment read covering its due channels.
+
+    .. code-block:: python
+
+        pcfs = [PCF8591(i2c, address) for address in range(0x48, 0x50)]
+        array = PCF8591Array(pcfs)
+        for device in range(len(pcfs)):
+            array.add_channel(device, A0, rate=100)
+            array.add_channel(device, A3, rate=5)
+        while True:
+            if array.poll():
+                print(array.read(0, A0))
+
+    :param devices: The PCF8591 devices to poll. They must all use the same I2C bus
+    """
+
+    def __init__(self, devices: typing.Sequence[PCF8591]) -> None:
+        if not devices:
+            raise ValueError("at least one device is required")
+        self._bus = devices[0].i2c_device.i2c
+        for pcf in devices:
+            if pcf.i2c_device.i2c is not self._bus:
+                raise ValueError("all devices must share the same I2C bus")
+        self._devices = tuple(devices)
+        count = len(devices) * 4
+        # per device and channel: period in ns (0 when not in the plan), next due time,
+        # samples taken and latest reading
+        self._periods = [0] * count
+        self._due = [0] * count
+        self._counts = [0] * count
+        self._values = bytearray(count)
+        self._planned = []
+        self._start = None
+        self.sweeps = 0
+        """The number of sweeps that read at least one device"""
+
+    @property
+    def devices(self) -> tuple[PCF8591, ...]:
+        """The polled devices"""
+        return self._devices
+
+    def add_channel(self, device: int, channel: int, rate: float | None = None) -> None:
+        """Add a channel to the polling plan
+
+        :param int device: The index of the device in `devices`
+        :param int channel: The ADC channel of the device to poll
+        :param float rate: The number of samples to take per second, or None to read the
+            channel on every sweep
+        """
+        pcf = self._devices[device]
+        if channel < 0 or channel >= pcf.channel_count:
+            raise ValueError(f"channel must be from 0-{pcf.channel_count - 1}")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        index = device * 4 + channel
+        self._periods[index] = 1 if rate is None else max(1, int(1_000_000_000 / rate))
+        self._due[index] = 0
+        self._counts[index] = 0
+        if index not in self._planned:
+            self._planned.append(index)
+            self._planned.sort()
+
+    def remove_channel(self, device: int, channel: int) -> None:
+        """Remove a channel from the polling plan
+
+        :param int device: The index of the device in `devices`
+        :param int channel: The ADC channel of the device to stop polling
+        """
+        index = device * 4 + channel
+        if index in self._planned:
+            self._planned.remove(index)
+            self._periods[index] = 0
+
+    def poll(self) -> int:
+        """Make one sweep of the bus, reading every channel that is due
+
+        :return: The number of channels that were read
+        """
+        now = time.monotonic_ns()
+        if self._start is None:
+            self._start = now
+        periods = self._periods
+        due = self._due
+        counts = self._counts
+        values = self._values
+        read = 0
+        bus = self._bus
+        while not bus.try_lock():
+            pass
+        try:
+            device = -1
+            last = -1
+            for index in self._planned:
+                if due[index] > now:
+                    continue
+                # channels are sorted, so each device's due channels arrive together
+                if index // 4 != device:
+                    if device >= 0:
+                        self._read_device(device, last)
+                    device = index // 4
+                last = index % 4
+            if device >= 0:
+                self._read_device(device, last)
+        finally:
+            bus.unlock()
+
+        if device < 0:
+            return 0
+        for index in self._planned:
+            if due[index] > now:
+                continue
+            scan_buffer = self._devices[index // 4]._scan_buffer
+            values[index] = scan_buffer[index % 4 + 1]
+            counts[index] += 1
+            # keep to the schedule unless a whole period behind, then restart it from now
+            next_due = due[index] + periods[index]
+            due[index] = next_due if next_due > now else now + periods[index]
+            read += 1
+        self.sweeps += 1
+        return read
+
+    def _read_device(self, device: int, last_channel: int) -> None:
+        pcf = self._devices[device]
+        pcf._scan(pcf.i2c_device, last_channel + 1)
+
+    def read(self, device: int, channel: int) -> int:
+        """The latest reading of a polled channel
+
+        :param int device: The index of the device in `devices`
+        :param int channel: The ADC channel of the device
+        """
+        return self._values[device * 4 + channel]
+
+    def achieved_rate(self, device: int, channel: int) -> float:
+        """The average number of samples per second taken of a channel since polling started
+
+        :param int device: The index of the device in `devices`
+        :param int channel: The ADC channel of the device
+        """
+        if self._start is None:
+            return 0.0
+        elapsed = time.monotonic_ns() - self._start
+        if elapsed <= 0:
+            return 0.0
+        return self._counts[device * 4 + channel] * 1_000_000_000 / elapsed
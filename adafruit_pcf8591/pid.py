@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`pid`
+================================================================================
+
+A fixed-rate PID controller that reads an ADC channel of a PCF8591 and drives its DAC.
+
+* Author(s): Adafruit Industries
+"""
+
+from __future__ import annotations
+
+import time
+
+from micropython import const
+
+from adafruit_pcf8591.scheduler import _next_deadline, _wait_until
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+# gains and the integral are fixed point with this many fractional bits
+_FRACTION_BITS = const(16)
+_HALF = const(1 << (_FRACTION_BITS - 1))
+
+
+class PIDController:
+    """A PID controller closing the loop from an ADC channel to the DAC of one `PCF8591`.
+
+    Each `tick` is a single `PCF8591.transceive` step, one I2C transaction. It writes the
+    output computed by the previous tick to the DAC, then reads the channel with a conversion
+    started after the DAC changed. The next output is then computed with fixed-point integer
+    math, so ticks don't allocate floats. Because each output is written by the next tick,
+    it reaches the DAC one period after the reading it was computed from.
+
+    The measurement, setpoint and output are raw 8-bit codes, and the gains are in DAC codes
+    per ADC code. The integral is clamped to the output limits, and stops integrating while
+    the output is saturated in the direction of the error, so it doesn't wind up. The
+    derivative acts on the measurement rather than the error, so setpoint changes don't kick
+    the output.
+
+    .. code-block:: python
+
+        pid = PIDController(pcf, A0, kp=0.8, ki=20, rate=500, setpoint=128)
+        pid.run(duration=10)
+        print(pid.achieved_rate, pid.max_late_ns, pid.missed)
+
+    :param ~adafruit_pcf8591.pcf8591.PCF8591 pcf: The PCF8591 to control with
+    :param int channel: The single-ended ADC channel measuring the process
+    :param float kp: The proportional gain
+    :param float ki: The integral gain, per second. Default is 0
+    :param float kd: The derivative gain, in seconds. Default is 0
+    :param float rate: The number of ticks per second. Default is 100
+    :param int setpoint: The target reading, 0-255. Default is 0
+    :param int output_min: The lowest DAC code to output. Default is 0
+    :param int output_max: The highest DAC code to output. Default is 255
+    """
+
+    def __init__(
+        self,
+        pcf: PCF8591,
+        channel: int,
+        kp: float,
+        ki: float = 0.0,
+        kd: float = 0.0,
+        rate: float = 100,
+        setpoint: int = 0,
+        output_min: int = 0,
+        output_max: int = 255,
+    ) -> None:
+        if channel < 0 or channel >= pcf.channel_count:
+            raise ValueError(f"channel must be from 0-{pcf.channel_count - 1}")
+        if pcf.is_differential(channel):
+            raise ValueError("channel must be single-ended")
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if not 0 <= output_min <= output_max <= 255:
+            raise ValueError("output limits must be from 0-255, with min no more than max")
+        self._pcf = pcf
+        self._channel = channel
+        self._rate = rate
+        self._period = int(1_000_000_000 / rate)
+        self._low = output_min << _FRACTION_BITS
+        self._high = output_max << _FRACTION_BITS
+        self._kp = self._ki = self._kd = 0
+        self.set_gains(kp, ki, kd)
+        self.setpoint = setpoint
+        self._out = bytearray(1)
+        self._in = bytearray(1)
+        self._output = output_min
+        self._integral = self._low
+        self._measurement = -1
+        self._running = False
+        self.reset_stats()
+        pcf.dac_enabled = True
+
+    def set_gains(self, kp: float, ki: float = 0.0, kd: float = 0.0) -> None:
+        """Change the gains, converting them to fixed point once
+
+        :param float kp: The proportional gain
+        :param float ki: The integral gain, per second
+        :param float kd: The derivative gain, in seconds
+        """
+        one = 1 << _FRACTION_BITS
+        self._kp = round(kp * one)
+        self._ki = round(ki / self._rate * one)
+        self._kd = round(kd * self._rate * one)
+
+    @property
+    def setpoint(self) -> int:
+        """The target reading, 0-255"""
+        return self._setpoint
+
+    @setpoint.setter
+    def setpoint(self, setpoint: int) -> None:
+        if setpoint < 0 or setpoint > 255:
+            raise ValueError("setpoint must be from 0-255")
+        self._setpoint = setpoint
+
+    @property
+    def measurement(self) -> int:
+        """The reading taken by the last tick, or -1 before the first"""
+        return self._measurement
+
+    @property
+    def output(self) -> int:
+        """The DAC code the next tick will write"""
+        return self._output
+
+    @property
+    def period_ns(self) -> int:
+        """The time between ticks in nanoseconds"""
+        return self._period
+
+    def reset(self) -> None:
+        """Clear the integral and derivative state, as after creating the controller"""
+        self._integral = self._low
+        self._measurement = -1
+        self._output = self._low >> _FRACTION_BITS
+
+    def reset_stats(self) -> None:
+        """Clear the timing statistics"""
+        self.ticks = 0
+        """The number of ticks run by `run`"""
+        self.missed = 0
+        """The number of tick periods skipped because `run` fell behind"""
+        self.max_late_ns = 0
+        """The latest any tick has started after its scheduled time, in nanoseconds"""
+        self.max_tick_ns = 0
+        """The longest any tick has taken, in nanoseconds"""
+        self._first_tick = 0
+        self._last_tick = 0
+
+    @property
+    def achieved_rate(self) -> float:
+        """The number of ticks per second achieved by `run`"""
+        elapsed = self._last_tick - self._first_tick
+        return (self.ticks - 1) * 1_000_000_000 / elapsed if elapsed else 0.0
+
+    def tick(self) -> int:
+        """Write the current output, read the channel and compute the next output
+
+        :return: The reading
+        """
+        pcf = self._pcf
+        if not pcf.dac_enabled:
+            raise RuntimeError("Underlying DAC is disabled, likely due to calling `deinit`")
+        self._out[0] = self._output
+        pcf.transceive(self._out, self._channel, self._in)
+        measurement = self._in[0]
+
+        error = self._setpoint - measurement
+        total = self._kp * error
+        if self._measurement >= 0:
+            total -= self._kd * (measurement - self._measurement)
+        self._measurement = measurement
+        integral = self._integral + self._ki * error
+        integral = max(self._low, min(self._high, integral))
+        total += integral
+        if total > self._high:
+            total = self._high
+            if error > 0:
+                integral = self._integral
+        elif total < self._low:
+            total = self._low
+            if error < 0:
+                integral = self._integral
+        self._integral = integral
+        self._output = (total + _HALF) >> _FRACTION_BITS
+        return measurement
+
+    def run(self, count: int | None = None, duration: float | None = None) -> None:
+        """Tick at the set rate against ``time.monotonic_ns()`` until `stop` is called, for
+        ``count`` ticks, or for ``duration`` seconds. Ticks are scheduled from a fixed start
+        so timing errors don't accumulate; whole periods that are missed are skipped
+
+        :param int count: The number of ticks to run, or None for no limit
+        :param float duration: How long to run for in seconds, or None for no limit
+        """
+        period = self._period
+        due = time.monotonic_ns()
+        end = None if duration is None else due + int(duration * 1_000_000_000)
+        ran = 0
+        self._running = True
+        while self._running and (count is None or ran < count) and (end is None or due < end):
+            now = _wait_until(due)
+            self.tick()
+            done = time.monotonic_ns()
+            ran += 1
+
+            if not self.ticks:
+                self._first_tick = now
+            self._last_tick = now
+            self.ticks += 1
+            self.max_late_ns = max(self.max_late_ns, now - due)
+            self.max_tick_ns = max(self.max_tick_ns, done - now)
+
+            next_due = _next_deadline(due, done, period)
+            self.missed += (next_due - due) // period - 1
+            due = next_due
+        self._running = False
+
+    def stop(self) -> None:
+        """Stop `run` after the current tick"""
+        self._running = False
@@ -0,0 +1,236 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`sampler`
+================================================================================
+
+Background sampling of PCF8591 ADC channels into a ring buffer.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* This module uses the ``threading`` module, so it is only supported on Linux
+  with Adafruit Blinka, not on CircuitPython boards.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+
+from adafruit_pcf8591.scheduler import _next_deadline
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from circuitpython_typing import WriteableBuffer
+
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+
+class PCF8591Sampler:
+    """Samples ADC channels of a `PCF8591` in a background thread at a fixed rate.
+
+    Each sample is timestamped with ``time.monotonic_ns()`` and stored in a fixed-size ring
+    buffer. All selected channels are read together with a single `PCF8591.read_all` per
+    sample.
+
+    The sampler can be passed to `AnalogIn` in place of the `PCF8591` so that ``value`` and
+    ``voltage`` return the latest buffered sample without accessing the bus.
+
+    While the sampler is running, other code using the same `PCF8591` (an `AnalogOut` for
+    example) must hold `lock` while doing so.
+
+    :param ~adafruit_pcf8591.pcf8591.PCF8591 pcf: The PCF8591 to sample.
+    :param channels: The ADC channels to sample. Default is every channel of the current
+        ``input_mode``
+    :param float rate: The number of samples to take per second. Default is 100
+    :param int size: The number of samples kept in the ring buffer. Default is 256
+    """
+
+    def __init__(
+        self,
+        pcf: PCF8591,
+        channels: typing.Sequence[int] | None = None,
+        rate: float = 100,
+        size: int = 256,
+    ) -> None:
+        count = pcf.channel_count
+        if channels is None:
+            channels = range(count)
+        for channel in channels:
+            if channel < 0 or channel >= count:
+                raise ValueError(f"channel must be from 0-{count - 1}")
+        if not channels:
+            raise ValueError("at least one channel must be sampled")
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if size < 2:
+            raise ValueError("size must be at least 2")
+
+        self._pcf = pcf
+        self._channels = bytes(channels)
+        # index into `_channels` for each ADC channel, or -1 when it isn't sampled
+        self._channel_index = [-1] * 4
+        for index, channel in enumerate(self._channels):
+            self._channel_index[channel] = index
+        self._period_ns = int(1_000_000_000 / rate)
+        self._size = size
+        self._scan = bytearray(count)
+        self._samples = array("B", bytes(size * len(self._channels)))
+        self._timestamps = array("q", bytes(8 * size))
+
+        # total number of samples written; only the sampling thread changes it, and only
+        # after the slot has been filled, so readers never need to take a lock
+        self._count = 0
+        self._read_count = 0
+        self.overruns = 0
+        """The number of sample periods missed because sampling fell behind the rate"""
+        self.dropped = 0
+        """The number of samples overwritten before being returned by `read_samples`"""
+        self.errors = 0
+        """The number of samples that failed with a bus error and were skipped. Sampling
+        carries on, so `sample_count` stops advancing while the bus keeps failing"""
+
+        self.lock = threading.Lock()
+        """Lock held around every access the sampler makes to the `PCF8591`"""
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def channels(self) -> bytes:
+        """The ADC channels being sampled, in the order they are stored"""
+        return self._channels
+
+    @property
+    def reference_voltage(self) -> float:
+        """The reference voltage of the sampled `PCF8591`"""
+        return self._pcf.reference_voltage
+
+    @property
+    def running(self) -> bool:
+        """True while the sampling thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def sample_count(self) -> int:
+        """The total number of samples taken since the sampler was created"""
+        return self._count
+
+    def is_differential(self, channel: int) -> bool:
+        """Whether an ADC channel is a differential input of the sampled `PCF8591`
+
+        :param int channel: The ADC channel to check
+        """
+        return self._pcf.is_differential(channel)
+
+    def start(self) -> None:
+        """Start the sampling thread"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread and wait for it to finish"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> PCF8591Sampler:
+        self.start()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        pcf = self._pcf
+        scan = self._scan
+        samples = self._samples
+        channels = self._channels
+        width = len(channels)
+        period = self._period_ns
+        deadline = time.monotonic_ns()
+        while not self._stop_event.is_set():
+            slot = self._count % self._size
+            self._timestamps[slot] = time.monotonic_ns()
+            try:
+                with self.lock:
+                    pcf.read_all(scan)
+            except OSError:
+                self.errors += 1
+            else:
+                offset = slot * width
+                for index in range(width):
+                    samples[offset + index] = scan[channels[index]]
+                self._count += 1
+
+            now = time.monotonic_ns()
+            next_deadline = _next_deadline(deadline, now, period)
+            self.overruns += (next_deadline - deadline) // period - 1
+            deadline = next_deadline
+            if now < deadline:
+                self._stop_event.wait((deadline - now) / 1_000_000_000)
+
+    def read(self, channel: int) -> int:
+        """Return the latest buffered raw reading of a channel without accessing the bus
+
+        :param int channel: The ADC channel to read; must be one of `channels`
+        """
+        index = self._channel_index[channel]
+        if index < 0:
+            raise ValueError("channel is not being sampled")
+        count = self._count
+        if not count:
+            raise RuntimeError("No samples have been taken yet")
+        return self._samples[((count - 1) % self._size) * len(self._channels) + index]
+
+    def read_samples(
+        self,
+        samples: WriteableBuffer,
+        timestamps: array | None = None,
+    ) -> int:
+        """Copy the samples taken since the last call, oldest first
+
+        Samples that were overwritten in the ring buffer before they could be copied are
+        counted in `dropped`.
+
+        :param samples: Buffer to fill with raw readings, one row of `channels` per sample
+        :param timestamps: Optional ``array`` to fill with the ``time.monotonic_ns()``
+            timestamp of each sample
+        :return: The number of samples copied
+        """
+        width = len(self._channels)
+        size = self._size
+        count = self._count
+        start = self._read_count
+        if count - start > size:
+            self.dropped += count - start - size
+            start = count - size
+        copied = min(count - start, len(samples) // width)
+        if timestamps is not None:
+            copied = min(copied, len(timestamps))
+        for row in range(copied):
+            slot = (start + row) % size
+            offset = slot * width
+            for index in range(width):
+                samples[row * width + index] = self._samples[offset + index]
+            if timestamps is not None:
+                timestamps[row] = self._timestamps[slot]
+        # the sampling thread may have lapped the rows being copied
+        lapped = self._count - size - start
+        if lapped > 0:
+            self.dropped += min(lapped, copied)
+        self._read_count = start + copied
+        return copied
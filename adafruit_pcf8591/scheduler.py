@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`scheduler`
+================================================================================
+
+Evenly spaced, timestamped sampling of PCF8591 ADC channels.
+
+* Author(s): Adafruit Industries
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from adafruit_pcf8591.pcf8591 import PCF8591
+
+# time before a deadline at which waiting stops sleeping and polls the clock
+_SPIN_NS = 2_000_000
+
+
+def _wait_until(deadline: int) -> int:
+    # sleep until shortly before a ``time.monotonic_ns()`` deadline, then poll the clock for
+    # the last moments to reduce jitter; returns the time the wait ended
+    now = time.monotonic_ns()
+    if deadline - now > _SPIN_NS:
+        time.sleep((deadline - now - _SPIN_NS) / 1_000_000_000)
+    while now < deadline:
+        now = time.monotonic_ns()
+    return now
+
+
+def _next_deadline(deadline: int, now: int, period: int) -> int:
+    # the deadline after one that has just been served at ``now``. A late deadline is still
+    # served straight away, but whole periods that have already passed are skipped so the
+    # work doesn't bunch up; the number skipped is (next - deadline) // period - 1
+    deadline += period
+    late = now - deadline
+    if late >= period:
+        deadline += late // period * period
+    return deadline
+
+
+class SampleStore:
+    """Timestamped samples stored as a struct of arrays: one ``array`` of timestamps, one of
+    timing errors, and one of readings for each channel.
+
+    :param int channels: The number of channels in each sample
+    :param int capacity: The number of samples the store can hold
+    """
+
+    def __init__(self, channels: int, capacity: int) -> None:
+        if channels < 1 or capacity < 1:
+            raise ValueError("channels and capacity must be at least 1")
+        self.timestamps = array("q", bytes(8 * capacity))
+        """The ``time.monotonic_ns()`` time each sample was taken"""
+        self.errors = array("q", bytes(8 * capacity))
+        """How late each sample was taken compared to its scheduled time, in nanoseconds"""
+        self.readings = tuple(array("B", bytes(capacity)) for _ in range(channels))
+        """The raw readings of each channel"""
+        self.capacity = capacity
+        self.length = 0
+        """The number of samples stored"""
+
+    @property
+    def full(self) -> bool:
+        """True when no more samples can be stored"""
+        return self.length >= self.capacity
+
+    def clear(self) -> None:
+        """Remove all the samples"""
+        self.length = 0
+
+
+class SampleScheduler:
+    """Samples ADC channels of a `PCF8591` at a fixed rate against ``time.monotonic_ns()``.
+
+    Sample times are scheduled from a fixed start time rather than from the previous sample,
+    so timing errors don't accumulate into drift. Every sample is stored with its timestamp
+    and how late it was. When a whole sample period is missed the scheduler skips ahead
+    rather than bunching samples together, and counts the skipped periods in `missed`.
+
+    .. code-block:: python
+
+        scheduler = SampleScheduler(pcf, rate=500, channels=(A0, A1), capacity=1000)
+        scheduler.run()
+        print(scheduler.store.readings[0], scheduler.missed, scheduler.max_error_ns)
+
+    :param ~adafruit_pcf8591.pcf8591.PCF8591 pcf: The PCF8591 to sample.
+    :param float rate: The number of samples to take per second
+    :param channels: The ADC channels to sample. Default is every channel of the current
+        ``input_mode``
+    :param int capacity: The number of samples to store, if ``store`` isn't given
+    :param SampleStore store: Optional store to add the samples to
+    """
+
+    def __init__(
+        self,
+        pcf: PCF8591,
+        rate: float,
+        channels: typing.Sequence[int] | None = None,
+        capacity: int = 1000,
+        store: SampleStore | None = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        count = pcf.channel_count
+        if channels is None:
+            channels = range(count)
+        for channel in channels:
+            if channel < 0 or channel >= count:
+                raise ValueError(f"channel must be from 0-{count - 1}")
+        self._channels = bytes(channels)
+        if store is None:
+            store = SampleStore(len(self._channels), capacity)
+        elif len(store.readings) != len(self._channels):
+            raise ValueError("store must have one array of readings per channel")
+        self.store = store
+        """The `SampleStore` holding the samples"""
+        self._pcf = pcf
+        self._period = int(1_000_000_000 / rate)
+        self._scan = bytearray(count)
+        self._next = None
+        self.missed = 0
+        """The number of sample periods skipped because sampling fell behind"""
+        self.max_error_ns = 0
+        """The latest any sample has been taken, in nanoseconds"""
+
+    @property
+    def period_ns(self) -> int:
+        """The time between samples in nanoseconds"""
+        return self._period
+
+    def start(self) -> None:
+        """Schedule the first sample for now. Called by the first `poll` if not called before"""
+        self._next = time.monotonic_ns()
+
+    def poll(self) -> bool:
+        """Take a sample if one is due
+
+        :return: True if a sample was taken
+        """
+        if self._next is None:
+            self.start()
+        now = time.monotonic_ns()
+        if now < self._next or self.store.full:
+            return False
+        self._sample(now)
+        return True
+
+    def run(self, count: int | None = None) -> int:
+        """Take samples until ``count`` have been taken or the store is full, sleeping between
+        them and polling the clock for the last moments before each one to reduce jitter
+
+        :param int count: The number of samples to take, or None to fill the store
+        :return: The number of samples taken
+        """
+        if self._next is None:
+            self.start()
+        taken = 0
+        while (count is None or taken < count) and not self.store.full:
+            self._sample(_wait_until(self._next))
+            taken += 1
+        return taken
+
+    def _sample(self, now: int) -> None:
+        store = self.store
+        index = store.length
+        error = now - self._next
+        if len(self._channels) == 1:
+            store.readings[0][index] = self._pcf.read(self._channels[0])
+        else:
+            self._pcf.read_all(self._scan)
+            for position, channel in enumerate(self._channels):
+                store.readings[position][index] = self._scan[channel]
+        store.timestamps[index] = now
+        store.errors[index] = error
+        store.length = index + 1
+        self.max_error_ns = max(error, self.max_error_ns)
+
+        period = self._period
+        deadline = _next_deadline(self._next, time.monotonic_ns(), period)
+        self.missed += (deadline - self._next) // period - 1
+        self._next = deadline
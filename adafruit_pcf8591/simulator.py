@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`simulator`
+================================================================================
+
+Software model of the PCF8591 and an I2C bus to attach it to, for running the driver,
+examples and benchmarks without hardware.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Intended for CPython on Linux, macOS or Windows. `SimulatedI2C` can be passed anywhere a
+  ``busio.I2C`` is expected, including to `PCF8591`.
+"""
+
+from __future__ import annotations
+
+import threading
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+
+_ENABLE_DAC = 0x40
+_INPUT_MODE_MASK = 0x30
+_AUTO_INCREMENT = 0x04
+_CHANNEL_MASK = 0x03
+# number of channels for each analog input program
+_CHANNEL_COUNTS = (4, 3, 3, 2)
+# the result read back before the first conversion, as on power up
+_RESET_RESULT = 0x80
+
+
+class SimulatedPCF8591:
+    """Model of the PCF8591 registers and conversion pipeline.
+
+    Input levels are raw 8-bit values relative to the reference voltage. As on the real chip,
+    a conversion of the selected channel is started as each byte is read, and its result is
+    returned by the *next* byte read, so the first byte of every read holds the result of the
+    previous conversion. With the auto-increment flag set the channel steps after each
+    conversion, wrapping at the channel count of the input program. Differential channels
+    convert to a two's complement difference.
+
+    :param int address: The I2C address the device answers to. Default is ``0x48``
+    :param inputs: The initial levels of AIN0 thru AIN3, each 0-255
+    """
+
+    def __init__(self, address: int = 0x48, inputs: typing.Sequence[int] = (0, 0, 0, 0)) -> None:
+        self.address = address
+        self.inputs = bytearray(inputs)
+        """The levels of AIN0 thru AIN3, each 0-255"""
+        self.control = 0
+        """The last control byte written"""
+        self.dac_value = 0
+        """The last value written to the DAC"""
+        self.dac_updates = 0
+        """The number of values written to the DAC"""
+        self.conversions = 0
+        """The number of A/D conversions made"""
+        self._result = _RESET_RESULT
+
+    @property
+    def dac_enabled(self) -> bool:
+        """True when the control byte has the analog output enabled"""
+        return bool(self.control & _ENABLE_DAC)
+
+    def _convert(self) -> int:
+        inputs = self.inputs
+        mode = (self.control & _INPUT_MODE_MASK) >> 4
+        channel = self.control & _CHANNEL_MASK
+        if mode == 0:
+            result = inputs[channel]
+        elif mode == 1:
+            result = inputs[channel] - inputs[3]
+        elif mode == 2:
+            result = inputs[channel] if channel < 2 else inputs[2] - inputs[3]
+        else:
+            pair = 2 * (channel & 1)
+            result = inputs[pair] - inputs[pair + 1]
+        if mode:
+            result = max(-128, min(127, result)) & 0xFF
+        if self.control & _AUTO_INCREMENT:
+            channel = (channel + 1) % _CHANNEL_COUNTS[mode]
+            self.control = (self.control & ~_CHANNEL_MASK) | channel
+        self.conversions += 1
+        return result
+
+    def write(self, buffer: ReadableBuffer, start: int = 0, end: int = None) -> None:
+        """Handle the bytes of a write: a control byte followed by DAC values
+
+        :param buffer: The bytes written to the device
+        :param int start: The index of the first byte written
+        :param int end: The index after the last byte written
+        """
+        if end is None:
+            end = len(buffer)
+        if start >= end:
+            return
+        self.control = buffer[start]
+        if end - start > 1:
+            self.dac_value = buffer[end - 1]
+            self.dac_updates += end - start - 1
+
+    def read_into(self, buffer: WriteableBuffer, start: int = 0, end: int = None) -> None:
+        """Fill a buffer with the bytes of a read, starting a conversion for each one
+
+        :param buffer: The buffer to fill
+        :param int start: The index of the first byte to fill
+        :param int end: The index after the last byte to fill
+        """
+        if end is None:
+            end = len(buffer)
+        # a while loop rather than range() so reads don't allocate
+        while start < end:
+            buffer[start] = self._result
+            self._result = self._convert()
+            start += 1
+
+
+class SimulatedI2C:
+    """An I2C bus with simulated devices attached, with the same interface as ``busio.I2C``.
+
+    Every transfer is counted: a write, a read, or a write and read joined by a repeated
+    start is one transaction. Bytes on the wire include the address byte of each message.
+
+    :param devices: The simulated devices attached to the bus
+    """
+
+    def __init__(self, *devices: SimulatedPCF8591) -> None:
+        self.devices = {}
+        """The attached devices, by address"""
+        for device in devices:
+            self.attach(device)
+        self._lock = threading.Lock()
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    def attach(self, device: SimulatedPCF8591) -> None:
+        """Attach a simulated device to the bus
+
+        :param device: The device to attach
+        """
+        self.devices[device.address] = device
+
+    def reset_counters(self) -> None:
+        """Set the transaction and byte counters, and those of the attached devices, back to
+        zero"""
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        for device in self.devices.values():
+            device.dac_updates = 0
+            device.conversions = 0
+
+    def _device(self, address: int) -> SimulatedPCF8591:
+        device = self.devices.get(address)
+        if device is None:
+            raise OSError(19, "No such device")
+        return device
+
+    def try_lock(self) -> bool:
+        """Attempt to lock the bus; returns True when successful"""
+        return self._lock.acquire(False)
+
+    def unlock(self) -> None:
+        """Release the bus lock"""
+        self._lock.release()
+
+    def scan(self) -> list[int]:
+        """The addresses of the attached devices"""
+        return sorted(self.devices)
+
+    def writeto(
+        self, address: int, buffer: ReadableBuffer, *, start: int = 0, end: int = None
+    ) -> None:
+        """Write bytes to a device"""
+        if end is None:
+            end = len(buffer)
+        self._device(address).write(buffer, start, end)
+        self.transactions += 1
+        self.bytes_written += end - start + 1
+
+    def readfrom_into(
+        self, address: int, buffer: WriteableBuffer, *, start: int = 0, end: int = None
+    ) -> None:
+        """Read bytes from a device into a buffer"""
+        if end is None:
+            end = len(buffer)
+        self._device(address).read_into(buffer, start, end)
+        self.transactions += 1
+        self.bytes_written += 1
+        self.bytes_read += end - start
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: int = None,
+        in_start: int = 0,
+        in_end: int = None,
+    ) -> None:
+        """Write bytes to a device, then read bytes from it after a repeated start"""
+        if out_end is None:
+            out_end = len(buffer_out)
+        if in_end is None:
+            in_end = len(buffer_in)
+        device = self._device(address)
+        device.write(buffer_out, out_start, out_end)
+        device.read_into(buffer_in, in_start, in_end)
+        self.transactions += 1
+        self.bytes_written += out_end - out_start + 2
+        self.bytes_read += in_end - in_start
+
+    def deinit(self) -> None:
+        """Release the bus; does nothing for a simulated bus"""
+
+    def __enter__(self) -> SimulatedI2C:
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.deinit()
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`waveform`
+================================================================================
+
+Precompiled waveforms for the PCF8591 DAC, played with timing control.
+
+* Author(s): Adafruit Industries
+"""
+
+from __future__ import annotations
+
+import math
+import time
+
+from micropython import const
+
+from adafruit_pcf8591.scheduler import _wait_until
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
+
+    from adafruit_pcf8591.analog_out import AnalogOut
+
+# Waveform shapes
+SINE = const(0)
+TRIANGLE = const(1)
+SQUARE = const(2)
+SAWTOOTH = const(3)
+
+# the longest table compiled when fitting several periods in a table to match the frequency
+_MAX_TABLE = const(1024)
+
+
+def _level(shape: int | tuple, phase: float) -> float:
+    # the level of the shape from -1 to 1 at a phase from 0 to 1
+    if shape == SINE:
+        return math.sin(2 * math.pi * phase)
+    if shape == TRIANGLE:
+        return 4 * phase - 1 if phase < 0.5 else 3 - 4 * phase
+    if shape == SQUARE:
+        return 1.0 if phase < 0.5 else -1.0
+    if shape == SAWTOOTH:
+        return 2 * phase - 1
+    # arbitrary levels evenly spaced over the period, interpolated linearly and wrapping
+    position = phase * len(shape)
+    index = int(position)
+    first = shape[index % len(shape)]
+    second = shape[(index + 1) % len(shape)]
+    return first + (second - first) * (position - index)
+
+
+def _fit(rate: float, frequency: float) -> tuple[int, int]:
+    # the table length and number of periods in it that come closest to the frequency
+    per_period = rate / frequency
+    length = max(2, round(per_period))
+    periods = 1
+    best = abs(rate / length - frequency)
+    count = 2
+    while best and round(count * per_period) <= _MAX_TABLE:
+        error = abs(rate * count / round(count * per_period) - frequency)
+        if error < best:
+            best = error
+            length = round(count * per_period)
+            periods = count
+        count += 1
+    return length, periods
+
+
+class Waveform:
+    """A waveform compiled by `WaveformPlayer.compile` to a table of 8-bit DAC codes holding a
+    whole number of periods
+
+    :param bytes samples: The DAC codes
+    :param float rate: The number of samples to play per second
+    :param int periods: The number of periods in ``samples``
+    :param float requested_frequency: The frequency the waveform was compiled for
+    """
+
+    def __init__(
+        self, samples: bytes, rate: float, periods: int, requested_frequency: float
+    ) -> None:
+        self.samples = samples
+        """The DAC codes, ready to stream"""
+        self.rate = rate
+        """The number of samples to play per second"""
+        self.periods = periods
+        """The number of periods in `samples`"""
+        self.requested_frequency = requested_frequency
+        """The frequency the waveform was compiled for"""
+
+    @property
+    def frequency(self) -> float:
+        """The frequency produced when played at `rate`, the closest to
+        `requested_frequency` a table of whole samples allows"""
+        return self.rate * self.periods / len(self.samples)
+
+
+class WaveformPlayer:
+    """Compiles waveforms to tables of DAC codes and plays them on an `AnalogOut`.
+
+    Compiled waveforms are cached by their settings, keeping the ``cache_size`` most recently
+    used, so switching back to a waveform costs nothing. The DAC calibration of the
+    `AnalogOut` is applied when compiling, so playing only streams bytes.
+
+    .. code-block:: python
+
+        player = WaveformPlayer(AnalogOut(pcf, OUT))
+        sine = player.compile(SINE, frequency=10, rate=1000)
+        player.play(sine, duration=5)
+        print(player.achieved_frequency, sine.requested_frequency)
+
+    :param ~adafruit_pcf8591.analog_out.AnalogOut dac: The DAC output to play waveforms on
+    :param int cache_size: The number of compiled waveforms to keep. Default is 8
+    """
+
+    def __init__(self, dac: AnalogOut, cache_size: int = 8) -> None:
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+        self._dac = dac
+        self._cache_size = cache_size
+        self._cache = {}
+        # cache keys, least recently used first
+        self._order = []
+        self.achieved_rate = 0.0
+        """The samples per second achieved by the last `play`"""
+        self.achieved_frequency = 0.0
+        """The frequency achieved by the last `play`"""
+
+    def compile(
+        self,
+        shape: int | typing.Sequence[float],
+        frequency: float,
+        rate: float,
+        amplitude: float | None = None,
+        offset: float | None = None,
+    ) -> Waveform:
+        """Compile a waveform, or return it from the cache if it was compiled before
+
+        :param shape: ``SINE``, ``TRIANGLE``, ``SQUARE``, ``SAWTOOTH``, or a sequence of
+            levels from -1 to 1 evenly spaced over one period
+        :param float frequency: The number of periods per second
+        :param float rate: The number of samples to play per second. At least two samples are
+            needed per period
+        :param float amplitude: The peak voltage either side of ``offset``. Default is half the
+            reference voltage
+        :param float offset: The voltage at the middle of the waveform. Default is half the
+            reference voltage
+        """
+        if not isinstance(shape, int):
+            shape = tuple(shape)
+            if not shape:
+                raise ValueError("shape must have at least one level")
+        if frequency <= 0 or rate <= 0:
+            raise ValueError("frequency and rate must be greater than 0")
+        if rate < 2 * frequency:
+            raise ValueError("rate must be at least twice the frequency")
+        reference_voltage = self._dac._pcf.reference_voltage
+        if amplitude is None:
+            amplitude = reference_voltage / 2
+        if offset is None:
+            offset = reference_voltage / 2
+        calibration = self._dac.calibration
+        table = None if calibration is None else calibration.dac_table
+        key = (shape, frequency, rate, amplitude, offset, id(table))
+
+        waveform = self._cache.get(key)
+        if waveform is not None:
+            self._order.remove(key)
+            self._order.append(key)
+            return waveform
+
+        length, periods = _fit(rate, frequency)
+
+        samples = bytearray(length)
+        scale = 256 / reference_voltage
+        for index in range(length):
+            phase = (index * periods / length) % 1
+            voltage = offset + amplitude * _level(shape, phase)
+            code = max(0, min(255, round(voltage * scale)))
+            samples[index] = code if table is None else table[code]
+        waveform = Waveform(bytes(samples), rate, periods, frequency)
+
+        if len(self._order) >= self._cache_size:
+            del self._cache[self._order.pop(0)]
+        self._cache[key] = waveform
+        self._order.append(key)
+        return waveform
+
+    @property
+    def cached(self) -> int:
+        """The number of compiled waveforms in the cache"""
+        return len(self._order)
+
+    def clear_cache(self) -> None:
+        """Remove every compiled waveform from the cache"""
+        self._cache.clear()
+        self._order.clear()
+
+    def play(
+        self,
+        waveform: Waveform,
+        duration: float | None = None,
+        loops: int = 1,
+        chunk_size: int = 1,
+    ) -> float:
+        """Play a waveform, writing each chunk of samples to the DAC when it's due so the
+        samples are spaced at the waveform's rate. The bus is only locked while each chunk is
+        written. When the bus can't keep up the samples are written as fast as it allows,
+        lowering the achieved frequency
+
+        :param Waveform waveform: The waveform to play
+        :param float duration: How long to play for in seconds. Overrides ``loops``
+        :param int loops: The number of times to play the whole table. Default is 1
+        :param int chunk_size: The number of samples sent in each I2C write. Within a chunk the
+            samples are sent as fast as the bus allows, so larger chunks reach higher rates
+            with less even spacing. Default is 1
+        :return: The achieved frequency, also kept in `achieved_frequency`
+        """
+        dac = self._dac
+        if not dac._pcf or not dac._pcf.dac_enabled:
+            raise RuntimeError("Underlying DAC is disabled, likely due to calling `deinit`")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        samples = memoryview(waveform.samples)
+        length = len(samples)
+        period = int(1_000_000_000 / waveform.rate)
+        total = None if duration is not None else loops * length
+        start = time.monotonic_ns()
+        end = None if duration is None else start + int(duration * 1_000_000_000)
+        written = 0
+        position = 0
+        now = start
+        while (total is None or written < total) and (end is None or now < end):
+            _wait_until(start + written * period)
+            count = min(chunk_size, length - position)
+            if total is not None:
+                count = min(count, total - written)
+            dac.write_samples(samples[position : position + count])
+            written += count
+            position = (position + count) % length
+            now = time.monotonic_ns()
+
+        # the last chunk plays until the next one would have been due
+        elapsed = max(now, start + written * period) - start
+        self.achieved_rate = written * 1_000_000_000 / elapsed if elapsed else 0.0
+        self.achieved_frequency = self.achieved_rate * waveform.periods / length
+        return self.achieved_frequency
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+"""Benchmark the time and memory taken to import the PCF8591 package.
+
+Each import is run many times, every time in a fresh interpreter, and reports the median
+import time, the memory allocated by the import and still held afterwards, and the number
+of modules it loaded. Results are printed as JSON so they can be stored and compared between
+runs:
+
+    python benchmarks/import_benchmark.py --runs 20 --output results.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+
+# the statements benchmarked, by name
+IMPORTS = {
+    "package": "import adafruit_pcf8591",
+    "package_pcf8591": "import adafruit_pcf8591; adafruit_pcf8591.PCF8591",
+    "package_all": (
+        "import adafruit_pcf8591; adafruit_pcf8591.PCF8591; adafruit_pcf8591.AnalogIn; "
+        "adafruit_pcf8591.AnalogOut"
+    ),
+    "pcf8591": "from adafruit_pcf8591.pcf8591 import PCF8591",
+    "analog_in": "from adafruit_pcf8591.analog_in import AnalogIn",
+    "analog_out": "from adafruit_pcf8591.analog_out import AnalogOut",
+}
+
+# run in the fresh interpreter: time and trace the statement, then report as JSON
+MEASURE = """
+import json, sys, time, tracemalloc
+before = set(sys.modules)
+tracemalloc.start()
+start = time.perf_counter_ns()
+exec({statement!r})
+elapsed = time.perf_counter_ns() - start
+retained, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+print(json.dumps({{
+    "ns": elapsed,
+    "retained_bytes": retained,
+    "peak_bytes": peak,
+    "modules": sorted(set(sys.modules) - before),
+}}))
+"""
+
+
+def measure(statement, runs):
+    """Run the statement in ``runs`` fresh interpreters and summarize the results"""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE.format(statement=statement)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output))
+    return {
+        "median_ns": statistics.median(sample["ns"] for sample in samples),
+        "min_ns": min(sample["ns"] for sample in samples),
+        "retained_bytes": statistics.median(sample["retained_bytes"] for sample in samples),
+        "peak_bytes": statistics.median(sample["peak_bytes"] for sample in samples),
+        "module_count": len(samples[-1]["modules"]),
+        "modules": samples[-1]["modules"],
+    }
+
+
+def main():
+    """Run the benchmarks and write the results as JSON"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="interpreters started per import")
+    parser.add_argument("--output", help="file to write the results to instead of stdout")
+    parser.add_argument("--only", action="append", help="run only the named import(s)")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": {},
+    }
+    for name, statement in IMPORTS.items():
+        if args.only and name not in args.only:
+            continue
+        results["benchmarks"][name] = measure(statement, args.runs)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
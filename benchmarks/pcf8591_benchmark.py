@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+"""Benchmark the PCF8591 driver against the simulated bus.
+
+Runs each operation many times on a `SimulatedI2C` and reports, per sample, the I2C
+transactions, bytes on the wire, Python time and peak memory allocated. Results are printed
+as JSON so they can be stored and compared between runs:
+
+    python benchmarks/pcf8591_benchmark.py --samples 5000 --output results.json
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from adafruit_pcf8591.analog_in import AnalogIn
+from adafruit_pcf8591.analog_out import AnalogOut
+from adafruit_pcf8591.pcf8591 import PCF8591
+from adafruit_pcf8591.pid import PIDController
+from adafruit_pcf8591.simulator import SimulatedI2C, SimulatedPCF8591
+
+BURST_SIZE = 64
+
+
+def make_device():
+    """Create a PCF8591 on a fresh simulated bus"""
+    i2c = SimulatedI2C(SimulatedPCF8591(inputs=(10, 80, 160, 240)))
+    return i2c, PCF8591(i2c)
+
+
+def benchmarks():
+    """Return (name, setup) pairs; setup returns (bus, operation, samples per operation)"""
+
+    def read_same_channel():
+        i2c, pcf = make_device()
+        return i2c, lambda: pcf.read(0), 1
+
+    def read_alternating_channels():
+        i2c, pcf = make_device()
+        channels = [0, 1]
+
+        def operation():
+            channels.reverse()
+            pcf.read(channels[0])
+
+        return i2c, operation, 1
+
+    def read_all():
+        i2c, pcf = make_device()
+        buffer = bytearray(4)
+        return i2c, lambda: pcf.read_all(buffer), 4
+
+    def read_burst():
+        i2c, pcf = make_device()
+        buffer = bytearray(BURST_SIZE)
+        return i2c, lambda: pcf.read_burst(0, buffer), BURST_SIZE
+
+    def analog_in_value():
+        i2c, pcf = make_device()
+        analog_in = AnalogIn(pcf, 0)
+        return i2c, lambda: analog_in.value, 1
+
+    def analog_in_voltage():
+        i2c, pcf = make_device()
+        analog_in = AnalogIn(pcf, 0)
+        return i2c, lambda: analog_in.voltage, 1
+
+    def analog_out_value():
+        i2c, pcf = make_device()
+        analog_out = AnalogOut(pcf)
+
+        def operation():
+            analog_out.value = 32768
+
+        return i2c, operation, 1
+
+    def write_stream():
+        i2c, pcf = make_device()
+        pcf.dac_enabled = True
+        samples = bytes(range(256))
+        return i2c, lambda: pcf.write_stream(samples), len(samples)
+
+    def write_then_read():
+        i2c, pcf = make_device()
+        pcf.dac_enabled = True
+
+        def operation():
+            pcf.write(128)
+            pcf.read(0)
+
+        return i2c, operation, 1
+
+    def transceive():
+        i2c, pcf = make_device()
+        pcf.dac_enabled = True
+        samples = bytes(range(BURST_SIZE))
+        buffer = bytearray(BURST_SIZE)
+        return i2c, lambda: pcf.transceive(samples, 0, buffer), BURST_SIZE
+
+    def pid_tick():
+        i2c, pcf = make_device()
+        pid = PIDController(pcf, 0, kp=0.5, ki=10, rate=1000, setpoint=128)
+        return i2c, pid.tick, 1
+
+    return [
+        ("read_same_channel", read_same_channel),
+        ("read_alternating_channels", read_alternating_channels),
+        ("read_all", read_all),
+        ("read_burst", read_burst),
+        ("AnalogIn.value", analog_in_value),
+        ("AnalogIn.voltage", analog_in_voltage),
+        ("AnalogOut.value", analog_out_value),
+        ("write_stream", write_stream),
+        ("write_then_read", write_then_read),
+        ("transceive", transceive),
+        ("PIDController.tick", pid_tick),
+    ]
+
+
+def measure_allocations(i2c, operation, operations):
+    """Return the peak and retained bytes allocated while running an operation repeatedly"""
+    # The bus counters are reset before each operation so that they stay small integers,
+    # which CPython doesn't allocate, and the loop doesn't count with integers for the same
+    # reason
+    reset_counters = i2c.reset_counters
+    loop = itertools.repeat(None, operations)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for _ in loop:
+        reset_counters()
+        operation()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - baseline, current - baseline
+
+
+def run(setup, operations):
+    """Time an operation and count its bus traffic and allocations"""
+    i2c, operation, samples = setup()
+    operation()  # warm up so one-time setup isn't measured
+    i2c.reset_counters()
+
+    start = time.perf_counter_ns()
+    for _ in range(operations):
+        operation()
+    elapsed = time.perf_counter_ns() - start
+    total = operations * samples
+    result = {
+        "samples": total,
+        "transactions_per_sample": i2c.transactions / total,
+        "bytes_per_sample": (i2c.bytes_written + i2c.bytes_read) / total,
+        "ns_per_sample": elapsed / total,
+    }
+
+    # measured separately as tracing slows everything down, less the allocations made by the
+    # measuring loop itself
+    peak, retained = measure_allocations(i2c, operation, operations)
+    loop_peak, loop_retained = measure_allocations(i2c, lambda: None, operations)
+    result["peak_alloc_bytes"] = max(0, peak - loop_peak)
+    result["retained_bytes"] = max(0, retained - loop_retained)
+    return result
+
+
+def main():
+    """Run the benchmarks and write the results as JSON"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=2000, help="operations per benchmark")
+    parser.add_argument("--output", help="file to write the results to instead of stdout")
+    parser.add_argument("--only", action="append", help="run only the named benchmark(s)")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": {},
+    }
+    for name, setup in benchmarks():
+        if args.only and name not in args.only:
+            continue
+        results["benchmarks"][name] = run(setup, args.samples)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
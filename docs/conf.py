@@ -34,10 +34,6 @@ intersphinx_mapping = {
         "https://docs.circuitpython.org/projects/busdevice/en/latest/",
         None,
     ),
-    "Register": (
-        "https://docs.circuitpython.org/projects/register/en/latest/",
-        None,
-    ),
     "CircuitPython": ("https://docs.circuitpython.org/en/latest/", None),
 }
 
@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+import time
+
+import board
+
+import adafruit_pcf8591.pcf8591 as PCF
+from adafruit_pcf8591.analog_in import AnalogIn
+from adafruit_pcf8591.sampler import PCF8591Sampler
+
+################ Background Sampler Example #####################
+#
+# This example shows how to sample all four ADC channels in a background
+# thread and read the latest values through AnalogIn without waiting on the bus.
+# It uses threads, so it only runs on Linux single board computers with Blinka.
+#
+# Wiring:
+# Connect voltage sources to the ADC channels, in addition to the
+# normal power and I2C connections. The voltage levels should be between 0V/GND and VCC
+#
+#################################################################
+i2c = board.I2C()  # uses board.SCL and board.SDA
+pcf = PCF.PCF8591(i2c)
+
+with PCF8591Sampler(pcf, rate=200) as sampler:
+    pcf_in_0 = AnalogIn(sampler, PCF.A0)
+    time.sleep(0.1)  # let the first samples arrive
+    while True:
+        print(f"Pin 0: {pcf_in_0.voltage:0.2f}V")
+        print(f"Samples: {sampler.sample_count} Overruns: {sampler.overruns}")
+        print("")
+        time.sleep(1)
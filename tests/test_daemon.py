@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+"""Tests for the acquisition daemon and its clients, run against the simulated bus"""
+
+import os
+import socket
+import stat
+import time
+from multiprocessing import shared_memory
+
+import pytest
+
+from adafruit_pcf8591.analog_in import AnalogIn
+from adafruit_pcf8591.analog_out import AnalogOut
+from adafruit_pcf8591.daemon import AcquisitionDaemon, DaemonClient
+from adafruit_pcf8591.pcf8591 import PCF8591
+from adafruit_pcf8591.simulator import SimulatedI2C, SimulatedPCF8591
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+@pytest.fixture
+def simulated():
+    device = SimulatedPCF8591(inputs=(10, 20, 30, 40))
+    return device, SimulatedI2C(device)
+
+
+@pytest.fixture
+def daemon(simulated, tmp_path):
+    _, bus = simulated
+    name = f"pcf8591-test-{os.getpid()}"
+    with AcquisitionDaemon(
+        [PCF8591(bus)], rate=1000, history=16, name=name, socket_path=str(tmp_path / "pcf.sock")
+    ) as daemon:
+        daemon.start()
+        assert _wait_for(lambda: daemon.sample_count > 0)
+        yield daemon
+
+
+@pytest.fixture
+def client(daemon):
+    client = DaemonClient(daemon.name, daemon.socket_path)
+    yield client
+    client.close()
+
+
+def test_client_reads_published_readings(simulated, daemon, client):
+    device, _ = simulated
+    pcf = client.device(0)
+    assert pcf.read(2) == 30
+    device.inputs[2] = 99
+    assert _wait_for(lambda: pcf.read(2) == 99)
+    assert AnalogIn(pcf, 1).value == 20 << 8
+
+
+def test_read_all_fills_the_callers_buffer(daemon, client):
+    buffer = bytearray(6)
+    assert client.device(0).read_all(buffer) is buffer
+    assert buffer == bytes((10, 20, 30, 40, 0, 0))
+
+
+def test_dac_writes_go_through_the_daemon(simulated, daemon, client):
+    device, _ = simulated
+    dac = AnalogOut(client.device(0))
+    dac.value = 200 << 8
+    assert device.dac_value == 200
+    assert device.dac_enabled
+
+
+def test_bad_commands_are_rejected_and_sampling_continues(daemon, client):
+    for arguments in ({"device": 0, "value": 256}, {"device": 1, "value": 1}, {"device": 0}):
+        with pytest.raises(RuntimeError):
+            client.command("write", **arguments)
+    count = daemon.sample_count
+    assert _wait_for(lambda: daemon.sample_count > count)
+    assert client.status()["errors"] == 0
+
+
+def test_bus_errors_are_counted_and_sampling_recovers(simulated, daemon, client):
+    device, bus = simulated
+    del bus.devices[device.address]
+    assert _wait_for(lambda: daemon.errors > 0)
+    bus.attach(device)
+    count = daemon.sample_count
+    assert _wait_for(lambda: daemon.sample_count > count)
+
+
+def test_misbehaving_clients_are_dropped(daemon, client):
+    # a client that sends commands and leaves without reading the replies
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as rude:
+        rude.connect(daemon.socket_path)
+        rude.sendall(b'{"command": "status"}\n' * 100)
+    # a client that never ends its command
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as endless:
+        endless.connect(daemon.socket_path)
+        with pytest.raises(OSError):
+            for _ in range(100):
+                endless.sendall(b"x" * 4096)
+                time.sleep(0.001)
+    assert daemon._thread.is_alive()
+    assert client.status()["devices"] == 1
+
+
+def test_socket_is_private(daemon):
+    assert stat.S_IMODE(os.stat(daemon.socket_path).st_mode) == 0o600
+
+
+def test_failed_bind_removes_the_segment(simulated, tmp_path):
+    _, bus = simulated
+    name = f"pcf8591-test-bind-{os.getpid()}"
+    with pytest.raises(OSError):
+        AcquisitionDaemon([PCF8591(bus)], name=name, socket_path=str(tmp_path / "no" / "sock"))
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+"""Tests for the PCF8591 driver, run against the simulated bus"""
+
+import tracemalloc
+
+import pytest
+
+from adafruit_pcf8591 import pcf8591
+from adafruit_pcf8591.pcf8591 import PCF8591
+from adafruit_pcf8591.simulator import SimulatedI2C, SimulatedPCF8591
+
+# a steady-state call must not allocate in the driver module
+_DRIVER = tracemalloc.Filter(True, pcf8591.__file__)
+
+
+def _pcf() -> PCF8591:
+    return PCF8591(SimulatedI2C(SimulatedPCF8591(inputs=(10, 20, 30, 40))))
+
+
+def _allocated(function, *args) -> int:
+    # the bytes allocated in the driver by repeated calls, after warming up
+    for _ in range(10):
+        function(*args)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces((_DRIVER,))
+        for _ in range(100):
+            function(*args)
+        after = tracemalloc.take_snapshot().filter_traces((_DRIVER,))
+    finally:
+        tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def test_read_does_not_allocate():
+    pcf = _pcf()
+    assert pcf.read(2) == 30
+    assert _allocated(pcf.read, 2) <= 0
+
+
+def test_write_does_not_allocate():
+    pcf = _pcf()
+    pcf.dac_enabled = True
+    assert _allocated(pcf.write, 200) <= 0
+
+
+def test_write_rejects_out_of_range_value():
+    pcf = _pcf()
+    pcf.dac_enabled = True
+    pcf.write(100)
+    with pytest.raises(ValueError):
+        pcf.write(256)
+    with pytest.raises(ValueError):
+        pcf.write(-1)
+    assert pcf._dacval == 100
+    assert pcf.read(0) == 10
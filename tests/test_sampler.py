@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+"""Tests for the background sampler, run against the simulated bus"""
+
+import time
+
+from adafruit_pcf8591.pcf8591 import PCF8591
+from adafruit_pcf8591.sampler import PCF8591Sampler
+from adafruit_pcf8591.simulator import SimulatedI2C, SimulatedPCF8591
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def test_sampler_keeps_sampling_through_bus_errors():
+    device = SimulatedPCF8591(inputs=(10, 20, 30, 40))
+    bus = SimulatedI2C(device)
+    sampler = PCF8591Sampler(PCF8591(bus), rate=1000)
+    with sampler:
+        assert _wait_for(lambda: sampler.sample_count > 0)
+        # the device stops answering, so every read fails with a NAK
+        del bus.devices[device.address]
+        assert _wait_for(lambda: sampler.errors >= 3)
+        assert sampler.running
+        device.inputs[0] = 99
+        bus.attach(device)
+        count = sampler.sample_count
+        assert _wait_for(lambda: sampler.sample_count > count)
+        assert sampler.read(0) == 99